@@ -79,17 +79,16 @@ def classify_with_model(content, lines_per_file=100, source_file="unknown.txt"):
         timestamp = datetime.datetime.utcnow().isoformat() + "Z"
 
         # Gather classification details
-        keywords_found = [
-            kw
-            for kw in model_output_validation.SCHEDULE_6_KEYWORDS.get(label.upper(), [])
-            if kw.lower() in text.lower()
-        ]
+        text_lower = text.lower()
+        keywords_found = model_output_validation.find_keywords(
+            text, label, text_lower=text_lower
+        )
         model_confidence = score
         keyword_confidence = model_output_validation.compute_keyword_confidence(
-            text, label
+            text, label, text_lower=text_lower
         )
         hybrid_conf = model_output_validation.hybrid_confidence(
-            model_confidence, text, label
+            model_confidence, text, label, text_lower=text_lower
         )
         validation_passed = hybrid_conf >= 0.7
 
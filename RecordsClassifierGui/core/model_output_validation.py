@@ -3,7 +3,9 @@ core.model_output_validation - Model output validation logic for Records Classif
 Moved under core/ for modular architecture. Update all imports to use core.model_output_validation.
 """
 
-from typing import Any, Dict, List, Callable, Optional, Tuple
+import functools
+import re
+from typing import Any, Dict, FrozenSet, List, Callable, Optional, Tuple
 # Attempt to import jsonschema, fallback to no-op validators
 try:
     import jsonschema
@@ -18,44 +20,30 @@ except ImportError:
         def validate(instance, schema):
             """No-op validate when jsonschema is unavailable."""
             return None
-    import logging
-    logging.warning("jsonschema not available, skipping JSON schema validation.")
-    class jsonschema:
-        class ValidationError(Exception):
-            """Placeholder for jsonschema ValidationError."""
-            pass
-        @staticmethod
-        def validate(instance, schema):
-            """No-op validate when jsonschema is unavailable."""
-            return None
+        class Draft7Validator:
+            """No-op validator when jsonschema is unavailable."""
+            def __init__(self, schema):
+                self.schema = schema
+            def iter_errors(self, instance):
+                return iter(())
+
+# Optional C accelerator for multi-pattern keyword matching
+try:
+    import ahocorasick
 except ImportError:
-    import logging
-    logging.warning("jsonschema module not found, skipping JSON schema validation.")
-    class jsonschema:
-        class ValidationError(Exception):
-            pass
-        @staticmethod
-        def validate(instance, schema):
-            return None
+    ahocorasick = None
+
+# Optional SIMD regex engine (Linux/x86 builds only); preferred over ahocorasick
+try:
+    import hyperscan
 except ImportError:
-    import logging
-    logging.warning("jsonschema module not found, JSON schema validation disabled.")
-    class jsonschema:
-        class ValidationError(Exception):
-            pass
-        @staticmethod
-        def validate(instance, schema):
-            return None
+    hyperscan = None
+
+# Optional ahead-of-time schema compiler; jsonschema is used without it
+try:
+    import fastjsonschema
 except ImportError:
-    # jsonschema not installed; skip JSON schema validation
-    import logging
-    logging.warning("jsonschema module not found, skipping JSON schema validation.")
-    class jsonschema:
-        @staticmethod
-        def validate(instance, schema):
-            return None
-        class ValidationError(Exception):
-            pass
+    fastjsonschema = None
 
 class ValidationError(Exception):
     """Custom exception for validation errors."""
@@ -257,24 +245,198 @@ SCHEDULE_6_KEYWORDS = {
     ],
 }
 
-def compute_keyword_confidence(text: str, classification: str) -> float:
+# Lookup tables derived from SCHEDULE_6_KEYWORDS; see rebuild_keyword_index
+_KW_BY_CLASS: Dict[str, FrozenSet[str]] = {}
+_CLASSES_BY_KW: Dict[str, Tuple[str, ...]] = {}
+_KW_PATTERNS: Dict[str, "re.Pattern[str]"] = {}
+
+def _build_keyword_tables() -> None:
+    """Populate the per-class keyword sets and the keyword -> classes index."""
+    _KW_BY_CLASS.clear()
+    _CLASSES_BY_KW.clear()
+    _KW_PATTERNS.clear()
+    for classification, keywords in SCHEDULE_6_KEYWORDS.items():
+        _KW_BY_CLASS[classification] = frozenset(keywords)
+        for kw in keywords:
+            _CLASSES_BY_KW[kw] = _CLASSES_BY_KW.get(kw, ()) + (classification,)
+            _KW_PATTERNS[kw] = re.compile(r"\b" + re.escape(kw) + r"\b")
+
+def _is_word_char(ch: str) -> bool:
+    """Match the definition of a word character used by ``\\b`` in ``re``."""
+    return ch.isalnum() or ch == "_"
+
+def _build_keyword_automaton():
+    """
+    Compile every Schedule 6 keyword into a single Aho-Corasick automaton.
+    Returns None when pyahocorasick is not installed.
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw in _CLASSES_BY_KW:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
+def _build_keyword_database():
+    """
+    Compile every Schedule 6 keyword into one Hyperscan database.
+    Patterns use ASCII ``\\b`` and report only their first match; UCP mode
+    would match ``re`` exactly but takes seconds to compile, so
+    _hyperscan_keywords rechecks the rare hits next to non-ASCII bytes.
+    Returns (database, keyword bytes by pattern id), or (None, ()) when
+    hyperscan is not installed.
+    """
+    if hyperscan is None:
+        return None, ()
+    keywords = tuple(kw.encode("utf-8") for kw in _CLASSES_BY_KW)
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[rb"\b" + re.escape(kw) + rb"\b" for kw in keywords],
+        ids=list(range(len(keywords))),
+        flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(keywords),
+    )
+    return database, keywords
+
+_build_keyword_tables()
+_AC_AUTOMATON = _build_keyword_automaton()
+_HS_DATABASE, _HS_KEYWORDS = _build_keyword_database()
+
+def _hyperscan_keywords(text_lower: str) -> Optional[set]:
+    """Scan with the Hyperscan database; None when it cannot be used."""
+    if _HS_DATABASE is None:
+        return None
+    try:
+        data = text_lower.encode("utf-8")
+    except UnicodeEncodeError:
+        return None  # lone surrogates are not valid UTF-8 input
+    found = set()
+    recheck = []
+    size = len(data)
+    def on_match(kw_id, start, end, flags, context):
+        kw = _HS_KEYWORDS[kw_id]
+        start = end - len(kw)
+        if (start > 0 and data[start - 1] >= 0x80) or (end < size and data[end] >= 0x80):
+            recheck.append(kw.decode("utf-8"))
+        else:
+            found.add(kw.decode("utf-8"))
+    _HS_DATABASE.scan(data, match_event_handler=on_match)
+    # An ASCII \b next to a non-ASCII letter is not a word boundary for re,
+    # and single-match patterns stop reporting, so look these up directly.
+    found.update(kw for kw in recheck if _KW_PATTERNS[kw].search(text_lower))
+    return found
+
+def _automaton_keywords(text_lower: str) -> Optional[set]:
+    """Scan with the Aho-Corasick automaton; None when it is not installed."""
+    if _AC_AUTOMATON is None:
+        return None
+    found = set()
+    last = len(text_lower) - 1
+    for end, kw in _AC_AUTOMATON.iter(text_lower):
+        if kw in found:
+            continue
+        start = end - len(kw) + 1
+        if start > 0 and _is_word_char(text_lower[start - 1]):
+            continue
+        if end < last and _is_word_char(text_lower[end + 1]):
+            continue
+        found.add(kw)
+    return found
+
+@functools.lru_cache(maxsize=32)
+def _keyword_hits(text_lower: str) -> Dict[str, FrozenSet[str]]:
+    """
+    Return the keywords present in ``text_lower``, grouped by classification.
+    Keywords only count as whole words, so "lease" does not match "please".
+    Uses one pass of Hyperscan or the automaton when available; results are
+    cached so the confidence helpers and validators share a single scan of
+    the same text. The returned mapping is shared between callers and must
+    not be modified.
+    """
+    found = _hyperscan_keywords(text_lower)
+    if found is None:
+        found = _automaton_keywords(text_lower)
+    if found is None:
+        found = {
+            kw
+            for kw in _CLASSES_BY_KW
+            if kw in text_lower and _KW_PATTERNS[kw].search(text_lower)
+        }
+    hits: Dict[str, set] = {}
+    for kw in found:
+        for classification in _CLASSES_BY_KW[kw]:
+            hits.setdefault(classification, set()).add(kw)
+    return {classification: frozenset(kws) for classification, kws in hits.items()}
+
+def rebuild_keyword_index() -> None:
+    """
+    Rebuild the keyword tables and matchers and drop cached hits.
+    Call this after SCHEDULE_6_KEYWORDS is modified at runtime.
+    """
+    global _AC_AUTOMATON, _HS_DATABASE, _HS_KEYWORDS
+    _build_keyword_tables()
+    _AC_AUTOMATON = _build_keyword_automaton()
+    _HS_DATABASE, _HS_KEYWORDS = _build_keyword_database()
+    _keyword_hits.cache_clear()
+    _compile_output_validators()
+
+def find_keywords(text: str, classification: str, text_lower: Optional[str] = None) -> List[str]:
+    """
+    Return the keywords of ``classification`` present in the text,
+    in the order they are listed in SCHEDULE_6_KEYWORDS.
+    text_lower: precomputed ``text.lower()`` to avoid lowercasing again.
+    """
+    cls = classification.upper()
+    keywords = SCHEDULE_6_KEYWORDS.get(cls)
+    if not keywords:
+        return []
+    hits = _keyword_hits(text.lower() if text_lower is None else text_lower)
+    class_hits = hits.get(cls)
+    if not class_hits:
+        return []
+    return [kw for kw in keywords if kw in class_hits]
+
+def compute_keyword_confidence(
+    text: str,
+    classification: str,
+    text_lower: Optional[str] = None,
+    classification_upper: Optional[str] = None,
+) -> float:
     """
     Compute a confidence score based on the presence of classification keywords in the text.
     Returns a float between 0.0 and 1.0.
+    text_lower: precomputed ``text.lower()`` to avoid lowercasing again.
+    classification_upper: precomputed ``classification.upper()``.
     """
-    keywords = SCHEDULE_6_KEYWORDS.get(classification.upper(), [])
-    if not keywords:
+    cls = classification.upper() if classification_upper is None else classification_upper
+    class_keywords = _KW_BY_CLASS.get(cls)
+    if not class_keywords:
         return 0.0
-    text_lower = text.lower()
-    matches = sum(1 for kw in keywords if kw in text_lower)
-    return matches / len(keywords) if keywords else 0.0
+    if text_lower is None:
+        text_lower = text.lower()
+    matches = len(_keyword_hits(text_lower).get(cls, ()))
+    return matches / len(class_keywords)
 
-def hybrid_confidence(model_confidence: float, text: str, classification: str, weight_model: float = 0.7) -> float:
+def hybrid_confidence(
+    model_confidence: float,
+    text: str,
+    classification: str,
+    weight_model: float = 0.7,
+    text_lower: Optional[str] = None,
+    classification_upper: Optional[str] = None,
+) -> float:
     """
     Combine model confidence and keyword-based confidence using a weighted average.
     weight_model: weight for model confidence (0.0-1.0), rest is for keyword confidence.
+    text_lower / classification_upper: precomputed normalized forms shared
+    with other validators.
     """
-    keyword_score = compute_keyword_confidence(text, classification)
+    keyword_score = compute_keyword_confidence(
+        text,
+        classification,
+        text_lower=text_lower,
+        classification_upper=classification_upper,
+    )
     return weight_model * model_confidence + (1 - weight_model) * keyword_score
 
 # Define the comprehensive JSON schema for model output
@@ -290,7 +452,11 @@ MODEL_OUTPUT_SCHEMA = {
             "type": "object",
             "properties": {
                 "schedule": {"type": "string"},
-                "keywords_found": {"type": "array", "items": {"type": "string"}},
+                "keywords_found": {
+                    "type": "array",
+                    "items": {"type": "string", "enum": sorted(_CLASSES_BY_KW)},
+                    "uniqueItems": True,
+                },
                 "hybrid_confidence": {"type": "number", "minimum": 0.0, "maximum": 1.0},
                 "model_confidence": {"type": "number", "minimum": 0.0, "maximum": 1.0},
                 "keyword_confidence": {"type": "number", "minimum": 0.0, "maximum": 1.0},
@@ -303,30 +469,52 @@ MODEL_OUTPUT_SCHEMA = {
     "required": ["label", "score", "text", "timestamp", "source_file", "classification_details"]
 }
 
+_COMPILED_OUTPUT_VALIDATOR = None
+_OUTPUT_SCHEMA_VALIDATOR = None
+
+def _compile_output_validators() -> None:
+    """
+    Build the validators for MODEL_OUTPUT_SCHEMA once: a specialized
+    fastjsonschema function when available (formats are not asserted,
+    matching jsonschema's default behaviour) and a reusable jsonschema
+    validator.  The keyword enum is refreshed from the current keyword index.
+    """
+    global _COMPILED_OUTPUT_VALIDATOR, _OUTPUT_SCHEMA_VALIDATOR
+    details = MODEL_OUTPUT_SCHEMA["properties"]["classification_details"]
+    details["properties"]["keywords_found"]["items"]["enum"] = sorted(_CLASSES_BY_KW)
+    if fastjsonschema is not None:
+        _COMPILED_OUTPUT_VALIDATOR = fastjsonschema.compile(MODEL_OUTPUT_SCHEMA, use_formats=False)
+    _OUTPUT_SCHEMA_VALIDATOR = jsonschema.Draft7Validator(MODEL_OUTPUT_SCHEMA)
+
+_compile_output_validators()
+
 def validate_json_schema(output: dict, schema: dict = MODEL_OUTPUT_SCHEMA) -> None:
     """
     Validate the output dict against the provided JSON schema.
     Raises ValidationError if validation fails.
     """
+    if schema is MODEL_OUTPUT_SCHEMA:
+        if _COMPILED_OUTPUT_VALIDATOR is not None:
+            try:
+                _COMPILED_OUTPUT_VALIDATOR(output)
+            except fastjsonschema.JsonSchemaException as e:
+                raise ValidationError(f"JSON schema validation error: {e.message}")
+            return
+        error = next(_OUTPUT_SCHEMA_VALIDATOR.iter_errors(output), None)
+        if error is not None:
+            raise ValidationError(f"JSON schema validation error: {error.message}")
+        return
     try:
         jsonschema.validate(instance=output, schema=schema)
     except jsonschema.ValidationError as e:
         raise ValidationError(f"JSON schema validation error: {e.message}")
 
-def fully_validate_model_output(output: dict) -> None:
+def _validate_output_fields(output: dict) -> None:
     """
-    Perform full, production-grade validation of model output for government workload.
-    This includes:
-    - JSON schema validation
-    - Atomic field validation
-    - Hybrid confidence computation
-    - Domain-specific checks (e.g., label/classification compliance)
-    Raises ValidationError on any failure.
+    Atomic type and range checks for every model output field.
+    Only needed when the compiled schema validator is unavailable, since
+    MODEL_OUTPUT_SCHEMA already encodes the same types and bounds.
     """
-    # 1. JSON schema validation
-    validate_json_schema(output)
-
-    # 2. Atomic field validation
     validate_type(output["label"], str)
     validate_type(output["score"], float)
     validate_range(output["score"], 0.0, 1.0)
@@ -346,30 +534,87 @@ def fully_validate_model_output(output: dict) -> None:
     if "notes" in details:
         validate_type(details["notes"], str)
 
-    # 3. Hybrid confidence check (recompute and compare)
-    recomputed_hybrid = hybrid_confidence(
-        details["model_confidence"], output["text"], output["label"]
-    )
-    if abs(recomputed_hybrid - details["hybrid_confidence"]) > 0.01:
-        raise ValidationError(f"Hybrid confidence mismatch: expected {recomputed_hybrid:.2f}, got {details['hybrid_confidence']:.2f}")
-
-    # 4. Domain-specific: label must be in allowed classes
-    allowed_labels = set(SCHEDULE_6_KEYWORDS.keys())
-    if output["label"].upper() not in allowed_labels:
-        raise ValidationError(f"Label '{output['label']}' not in allowed classes: {allowed_labels}")
-
-    # 5. Domain-specific: keywords_found must be subset of class keywords
-    class_keywords = set(SCHEDULE_6_KEYWORDS[output["label"].upper()])
-    found_keywords = set(details["keywords_found"])
-    if not found_keywords.issubset(class_keywords):
-        raise ValidationError(f"keywords_found {found_keywords} not subset of class keywords {class_keywords}")
-
-    # 6. Domain-specific: validation_passed must be True if hybrid_confidence >= 0.7
-    if details["hybrid_confidence"] >= 0.7 and not details["validation_passed"]:
+def fully_validate_model_output(output: dict, skip_hybrid_recheck: bool = False) -> None:
+    """
+    Perform full, production-grade validation of model output for government workload.
+    This includes:
+    - Label/classification compliance
+    - JSON schema validation
+    - Atomic field validation
+    - Domain-specific keyword and threshold checks
+    - Hybrid confidence computation
+    Checks run cheapest first, so the keyword scan behind the hybrid
+    recompute is only paid for outputs that pass everything else.
+    skip_hybrid_recheck: trust the stored hybrid_confidence instead of
+    recomputing it, for callers that produced it with hybrid_confidence.
+    Raises ValidationError on any failure.
+    """
+    # 1. Domain-specific: label must be in allowed classes.  The per-class
+    # keyword table doubles as the allowed-label set, so one lookup serves
+    # both this check and the subset check below.  Non-string labels are
+    # left for the schema to report.
+    label = output.get("label")
+    if isinstance(label, str):
+        label_u = label.upper()
+        class_keywords = _KW_BY_CLASS.get(label_u)
+        if class_keywords is None:
+            raise ValidationError(f"Label '{label}' not in allowed classes: {set(_KW_BY_CLASS)}")
+
+    # 2. JSON schema validation
+    validate_json_schema(output)
+
+    # 3. Atomic field validation (covered by the compiled schema when present)
+    if _COMPILED_OUTPUT_VALIDATOR is None:
+        _validate_output_fields(output)
+    details = output["classification_details"]
+    stored_hybrid = details["hybrid_confidence"]
+    keywords_found = details["keywords_found"]
+
+    # 4. Domain-specific: keywords_found must be subset of class keywords
+    if not class_keywords.issuperset(keywords_found):
+        found_keywords = set(keywords_found)
+        raise ValidationError(f"keywords_found {found_keywords} not subset of class keywords {set(class_keywords)}")
+
+    # 5. Domain-specific: validation_passed must be True if hybrid_confidence >= 0.7
+    if stored_hybrid >= 0.7 and not details["validation_passed"]:
         raise ValidationError("validation_passed must be True if hybrid_confidence >= 0.7")
 
+    # 6. Hybrid confidence check (recompute and compare at two decimals)
+    if not skip_hybrid_recheck:
+        text = output["text"]
+        recomputed_hybrid = hybrid_confidence(
+            details["model_confidence"],
+            text,
+            label,
+            text_lower=text.lower(),
+            classification_upper=label_u,
+        )
+        if round(recomputed_hybrid * 100) != round(stored_hybrid * 100):
+            raise ValidationError(f"Hybrid confidence mismatch: expected {recomputed_hybrid:.2f}, got {stored_hybrid:.2f}")
+
     # 7. (Optional) Add more government workload checks as needed in the future
 
+def fully_validate_model_outputs(
+    outputs: List[dict], skip_hybrid_recheck: bool = False
+) -> List[Optional[ValidationError]]:
+    """
+    Validate a batch of model outputs in one pass.
+    Returns one entry per output: None when it is valid, otherwise the
+    ValidationError that fully_validate_model_output would have raised.
+    The compiled schema, keyword tables and automaton are module-level, so
+    per-output work is limited to the checks themselves.
+    """
+    errors: List[Optional[ValidationError]] = []
+    append = errors.append
+    for output in outputs:
+        try:
+            fully_validate_model_output(output, skip_hybrid_recheck=skip_hybrid_recheck)
+        except ValidationError as ve:
+            append(ve)
+        else:
+            append(None)
+    return errors
+
 # Additional domain-specific validators can be implemented here when
 # expanded classification logic is required.  This placeholder block was
 # previously used for demonstration purposes and has been removed for
@@ -8,16 +8,28 @@ and graceful fallback when LLM services are unavailable.
 
 import os
 import sys
+import asyncio
+import functools
+import importlib
 import json
 import re
 import datetime
 import threading
+import time
 from pathlib import Path
-from typing import Dict, Any, List, Set, Optional, Union
+from typing import Dict, Any, List, Set, Optional, Tuple, Union
 from dataclasses import dataclass
 import logging
 import concurrent.futures
 
+from .classifier_cache import ResponseCache
+from .file_scanner import extract_file_content
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -34,7 +46,123 @@ EXCLUDE_EXT: Set[str] = frozenset({
     '.psm1', '.db', '.mdb', '.accdb'
 })
 
-@dataclass
+# Container formats whose raw bytes are not text; these go through the
+# per-type extractors in file_scanner instead of a byte-prefix decode
+_EXTRACTED_EXT = frozenset({'.pdf', '.docx', '.doc', '.pptx', '.xlsx'})
+
+# Most content characters ever sent to the model for one file
+MAX_CONTENT_CHARS = 5000
+
+# Plain-text reads pull this many bytes at a time until max_lines are buffered
+_READ_CHUNK_BYTES = 64 * 1024
+
+# Surface-cue rules checked before the LLM:
+# (pattern, determination, confidence, reason)
+DEFAULT_PRECLASSIFY_RULES: List[Tuple[str, str, int, str]] = [
+    (r'(?i)\bdraft\b|\bscratch\b|\btemp(orary)?\b', "TRANSITORY", 85, "Draft/temp marker"),
+    (r'(?i)meeting\s+notes|agenda', "TRANSITORY", 70, "Meeting notes"),
+    (r'(?i)\bcontract\b|\bagreement\b|\bpolicy\b', "KEEP", 75, "Policy/contract"),
+]
+
+# Only the head of a file is checked against the rules
+PRECLASSIFY_CHARS = 1024
+
+def _load_preclassify_rules(
+    path: Optional[str] = None
+) -> List[Tuple["re.Pattern[str]", str, int, str]]:
+    """
+    Compile the pre-classification rules.
+
+    ``path`` (default: ``PCRC_PRECLASSIFY_RULES``) may name a YAML file
+    holding a list of ``{pattern, determination, confidence, reason}``
+    mappings that replaces the defaults; an empty list disables the rules.
+    """
+    if path is None:
+        path = os.environ.get("PCRC_PRECLASSIFY_RULES")
+    rules = DEFAULT_PRECLASSIFY_RULES
+    if path:
+        if yaml is None:
+            logger.warning(f"PyYAML not installed; ignoring rules file {path}")
+        else:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    rules = [
+                        (r['pattern'], r['determination'], int(r['confidence']), r['reason'])
+                        for r in (yaml.safe_load(f) or [])
+                    ]
+            except Exception as e:
+                logger.warning(f"Failed to load rules file {path}: {e}")
+    return [
+        (re.compile(pattern), determination, confidence, reason)
+        for pattern, determination, confidence, reason in rules
+    ]
+
+_PRECLASSIFY_RULES = _load_preclassify_rules()
+
+def _preclassify(content: str) -> Optional[Tuple[str, int, str]]:
+    """
+    Return (determination, confidence, reason) for the first rule that fires.
+
+    If rules with different determinations fire (a contract that mentions a
+    "draft"), None is returned so the LLM weighs the conflicting cues.
+    """
+    snippet = content[:PRECLASSIFY_CHARS]
+    first = None
+    for rx, determination, confidence, reason in _PRECLASSIFY_RULES:
+        if rx.search(snippet):
+            if first is None:
+                first = (determination, confidence, reason)
+            elif determination != first[0]:
+                return None
+    return first
+
+# Generation options shared by every call; temperature and system are per call
+_GEN_CONFIG_BASE: Dict[str, Any] = {
+    "top_p": 0.9,
+    "top_k": 40,
+    "num_ctx": 8192,
+    "repeat_penalty": 1.2,
+    "stop": ["<end_of_turn>", "```"],
+    # A single classification object is tiny; this bounds worst-case time
+    "num_predict": 256,
+}
+
+_VALID_DETERMINATIONS = frozenset({"TRANSITORY", "DESTROY", "KEEP"})
+
+def _extract_json_span(raw: str, opener: str, closer: str) -> Optional[str]:
+    """
+    Return the first balanced ``opener``...``closer`` span in ``raw``.
+
+    Walks the text once, tracking nesting depth and JSON string state so
+    nested objects and brackets inside strings are handled. Returns None
+    when no opener is found or it is never closed.
+    """
+    start = raw.find(opener)
+    if start < 0:
+        return None
+    depth = 0
+    in_str = False
+    esc = False
+    for j in range(start, len(raw)):
+        c = raw[j]
+        if in_str:
+            if esc:
+                esc = False
+            elif c == '\\':
+                esc = True
+            elif c == '"':
+                in_str = False
+        elif c == '"':
+            in_str = True
+        elif c == opener:
+            depth += 1
+        elif c == closer:
+            depth -= 1
+            if depth == 0:
+                return raw[start:j + 1]
+    return None
+
+@dataclass(slots=True)
 class ClassificationResult:
     """Structured result from file classification."""
     file_name: str
@@ -50,53 +178,306 @@ class ClassificationResult:
 
 class LLMEngine:
     """Handles LLM interactions with proper timeout and error handling."""
+
+    # Consecutive call failures that switch the engine to degraded mode
+    DEGRADE_AFTER_FAILURES = 2
+    # Consecutive healthy probes needed to leave degraded mode
+    RECOVER_AFTER_PROBES = 3
+    PROBE_TIMEOUT_SECONDS = 2
+    # Pooled HTTP connections to the Ollama server
+    MAX_CONNECTIONS = 32
     
-    def __init__(self, timeout_seconds: int = 30):
+    # Floor for the length-scaled per-call timeout
+    MIN_CALL_TIMEOUT_SECONDS = 5.0
+
+    # Set once any engine's probe reaches the service; later engines skip it
+    _global_available: Optional[bool] = None
+    
+    def __init__(
+        self,
+        timeout_seconds: int = 30,
+        cache: Optional[ResponseCache] = None,
+        throughput_tokens_per_sec: float = 30.0
+    ):
         self.timeout_seconds = timeout_seconds
+        self.throughput_tokens_per_sec = throughput_tokens_per_sec
+        # Disk caching is opt-in (PCRC_CACHE_DIR); see classifier_cache
+        self.cache = cache if cache is not None else ResponseCache.from_env()
         self.ollama_available = False
-        self._initialize_ollama()
+        self._health_lock = threading.Lock()
+        self._consecutive_failures = 0
+        self._healthy_probes = 0
+        self._degraded_until = 0.0
+        self._probing = False
+        self._probe_interval = 30.0
+        self.ollama = None
+        self._aclient = None
+        self._loop = None
+        self._loop_thread: Optional[threading.Thread] = None
+        # Ollama is set up on first use, so engines that never reach the
+        # LLM (or only hit the cache) pay no startup probe
+        self._probe_done = False
+        self._probe_lock = threading.Lock()
+
+    def _ensure_probed(self) -> None:
+        """Initialize the Ollama client at most once per engine."""
+        if self._probe_done:
+            return
+        with self._probe_lock:
+            if not self._probe_done:
+                self._initialize_ollama()
+                self._probe_done = True
     
     def _initialize_ollama(self):
-        """Initialize ollama with timeout protection using threading."""
+        """Import ollama and probe the service through the shared event loop."""
         try:
-            # Use threading-based timeout for Windows compatibility
-            ollama_result = {'ollama': None, 'available': False, 'error': None}
-            
-            def load_ollama():
-                try:
-                    import ollama
-                    ollama_result['ollama'] = ollama
-                    # Test if ollama service is actually running
-                    models = ollama.list()
-                    ollama_result['available'] = True
-                    logger.info("Ollama service is available")
-                except Exception as e:
-                    ollama_result['error'] = e
-                    logger.warning(f"Ollama import succeeded but service unavailable: {e}")
-            
-            # Start the import in a thread with timeout
-            thread = threading.Thread(target=load_ollama)
-            thread.daemon = True
-            thread.start()
-            thread.join(timeout=10)  # 10-second timeout
-            
-            if thread.is_alive():
-                logger.warning("Ollama initialization timed out")
-                self.ollama = None
-                self.ollama_available = False
-            elif ollama_result['error']:
-                logger.warning(f"Ollama not available: {ollama_result['error']}")
-                self.ollama = None
-                self.ollama_available = False
-            else:
-                self.ollama = ollama_result['ollama']
-                self.ollama_available = ollama_result['available']
-                
+            # Importing does no network I/O; only the probe below can hang
+            self.ollama = importlib.import_module('ollama')
+        except Exception as e:
+            logger.warning(f"Ollama not available: {e}")
+            return
+
+        try:
+            # The client keeps one pooled httpx session for the engine's
+            # lifetime, so calls reuse keep-alive connections; size the pool
+            # for process_files' concurrent workers.
+            httpx = importlib.import_module('httpx')
+            aclient = self.ollama.AsyncClient(
+                timeout=self.timeout_seconds,
+                limits=httpx.Limits(
+                    max_keepalive_connections=self.MAX_CONNECTIONS,
+                    max_connections=self.MAX_CONNECTIONS,
+                ),
+            )
         except Exception as e:
-            logger.warning(f"Ollama initialization failed: {e}")
-            self.ollama = None
-            self.ollama_available = False
+            logger.warning(f"Could not create Ollama client: {e}")
+            return
+
+        # One event loop per engine, driven by a single daemon thread, serves
+        # every call so classifications never spawn threads of their own.
+        self._aclient = aclient
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever, name="ollama-loop", daemon=True
+        )
+        self._loop_thread.start()
+
+        try:
+            if not LLMEngine._global_available:
+                self._run(self._aclient.list(), timeout=10)
+                LLMEngine._global_available = True
+                logger.info("Ollama service is available")
+            self.ollama_available = True
+        except asyncio.TimeoutError:
+            logger.warning("Ollama initialization timed out")
+            self._shutdown()
+        except Exception as e:
+            logger.warning(f"Ollama import succeeded but service unavailable: {e}")
+            self._shutdown()
+
+    def close(self) -> None:
+        """Close the pooled HTTP session and stop the engine's event loop."""
+        self._probe_done = True
+        self._shutdown()
+
+    def _shutdown(self) -> None:
+        """Close the client, then stop, join and close the event loop."""
+        self.ollama_available = False
+        aclient, self._aclient = self._aclient, None
+        loop, self._loop = self._loop, None
+        thread, self._loop_thread = self._loop_thread, None
+        if loop is None or loop.is_closed():
+            return
+        # ollama releases connections with close(); very old clients lack it
+        # and leave the session to the garbage collector
+        close_client = getattr(aclient, 'close', None)
+        if close_client is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(
+                    asyncio.wait_for(close_client(), timeout=5), loop
+                ).result()
+            except Exception as e:
+                logger.debug(f"Error closing Ollama client: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=5)
+        if not loop.is_running():
+            loop.close()
+
+    def _run(self, coro, timeout: float):
+        """Run ``coro`` on the engine loop, cancelling it after ``timeout`` seconds."""
+        future = asyncio.run_coroutine_threadsafe(
+            asyncio.wait_for(coro, timeout=timeout), self._loop
+        )
+        return future.result()
     
+    def _record_call(self, ok: bool) -> None:
+        """Track call outcomes, entering degraded mode after repeated failures."""
+        with self._health_lock:
+            if ok:
+                self._consecutive_failures = 0
+                return
+            self._consecutive_failures += 1
+            if self._consecutive_failures >= self.DEGRADE_AFTER_FAILURES:
+                if not self._degraded_until:
+                    logger.warning("LLM calls failing; switching to degraded mode")
+                self._degraded_until = time.monotonic() + self._probe_interval
+                self._healthy_probes = 0
+
+    def _llm_ready(self) -> bool:
+        """Return True when calls should reach the LLM.
+
+        While degraded, calls are skipped until the probe interval expires;
+        after that one caller at a time runs a cheap ``list()`` probe, with
+        the lock released, while the others keep the degraded fallback. The
+        engine recovers once enough probes in a row succeed.
+        """
+        if not self.ollama_available or not self._aclient:
+            return False
+        with self._health_lock:
+            if not self._degraded_until:
+                return True
+            if self._probing or time.monotonic() < self._degraded_until:
+                return False
+            self._probing = True
+        try:
+            self._run(self._aclient.list(), timeout=self.PROBE_TIMEOUT_SECONDS)
+            healthy = True
+        except Exception:
+            healthy = False
+        with self._health_lock:
+            self._probing = False
+            if not healthy:
+                self._healthy_probes = 0
+                self._degraded_until = time.monotonic() + self._probe_interval
+                return False
+            self._healthy_probes += 1
+            if self._healthy_probes < self.RECOVER_AFTER_PROBES:
+                return False
+            logger.info("LLM service recovered; leaving degraded mode")
+            self._degraded_until = 0.0
+            self._consecutive_failures = 0
+            self._healthy_probes = 0
+            return True
+
+    def _generation_config(self, temperature: float, system_instructions: str) -> Dict[str, Any]:
+        return {
+            **_GEN_CONFIG_BASE,
+            "temperature": max(0.0, min(1.0, temperature)),
+            "system": system_instructions
+        }
+
+    def _call_timeout(self, prompt_chars: int, output_tokens: Optional[int] = None) -> float:
+        """
+        Time budget for one call, scaled to the prompt length.
+
+        Estimates the prompt at four characters per token plus the reply's
+        token cap (``num_predict``, 256 unless overridden) and allows 1.5x
+        the time the configured throughput needs. The result is at least
+        MIN_CALL_TIMEOUT_SECONDS and never more than ``timeout_seconds``.
+        Because the reply alone may need that long, even an empty prompt
+        gets about 13 s at the default 30 tokens/s; long prompts get up to
+        the full budget.
+        """
+        if output_tokens is None:
+            output_tokens = _GEN_CONFIG_BASE["num_predict"]
+        est_tokens = prompt_chars // 4 + output_tokens
+        budget = est_tokens / self.throughput_tokens_per_sec * 1.5
+        return min(self.timeout_seconds, max(self.MIN_CALL_TIMEOUT_SECONDS, budget))
+
+    async def _stream_until_json(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        options: Dict[str, Any],
+        opener: str,
+        closer: str
+    ) -> str:
+        """
+        Stream a chat response, stopping once a complete JSON value arrives.
+
+        Whatever the model would have generated after the closing bracket
+        is never produced: closing the stream disconnects from Ollama.
+        """
+        stream = await self._aclient.chat(
+            model=model, messages=messages, options=options, stream=True
+        )
+        parts: List[str] = []
+        try:
+            async for chunk in stream:
+                # Chunks are subscriptable like the dicts older clients returned
+                piece = chunk["message"]["content"] or ""
+                parts.append(piece)
+                if closer in piece and _extract_json_span("".join(parts), opener, closer):
+                    break
+        finally:
+            aclose = getattr(stream, "aclose", None)
+            if aclose is not None:
+                await aclose()
+        return "".join(parts)
+
+    def _chat(
+        self,
+        model: str,
+        system_instructions: str,
+        prompt: str,
+        temperature: float,
+        timeout: Optional[float] = None,
+        expect: str = "{}",
+        num_predict: Optional[int] = None
+    ) -> str:
+        """
+        Send one prompt to the model and return the raw response text.
+
+        ``expect`` is the bracket pair of the JSON value the caller wants;
+        streaming stops as soon as one is complete. ``num_predict``
+        overrides the output token cap.
+        """
+        if timeout is None:
+            timeout = self._call_timeout(
+                len(prompt) + len(system_instructions or ""), num_predict
+            )
+        options = self._generation_config(temperature, system_instructions)
+        if num_predict is not None:
+            options["num_predict"] = num_predict
+        messages = [
+            {"role": "system", "content": system_instructions or ""},
+            {"role": "user", "content": prompt},
+        ]
+        try:
+            raw = self._run(
+                self._stream_until_json(model, messages, options, expect[0], expect[1]),
+                timeout=timeout,
+            )
+        except Exception:
+            self._record_call(ok=False)
+            raise
+        self._record_call(ok=True)
+        return raw
+
+    @staticmethod
+    def _validate_result(result: Any) -> None:
+        """Raise ValueError unless ``result`` is a well-formed classification."""
+        if not isinstance(result, dict):
+            raise ValueError(f"Expected a JSON object, got: {str(result)[:200]}")
+
+        for key in ("modelDetermination", "confidenceScore", "contextualInsights"):
+            if key not in result:
+                raise ValueError(f"Missing required key: {key}")
+
+        determination = result["modelDetermination"]
+        if not isinstance(determination, str) or determination not in _VALID_DETERMINATIONS:
+            raise ValueError(
+                f"Invalid modelDetermination: {determination} "
+                "(must be TRANSITORY, DESTROY, or KEEP)"
+            )
+        score = result["confidenceScore"]
+        if not isinstance(score, (int, float)) or not 1 <= score <= 100:
+            raise ValueError(f"Invalid confidenceScore: {score} (must be number 1-100)")
+        insights = result["contextualInsights"]
+        if not isinstance(insights, str):
+            raise ValueError(f"Invalid contextualInsights: {insights} (must be string)")
+
     def classify_with_llm(
         self,
         model: str,
@@ -106,121 +487,193 @@ class LLMEngine:
     ) -> Dict[str, Any]:
         """Classify content using LLM with robust error handling."""
         
-        if not self.ollama_available or not self.ollama:
+        if self.cache is not None:
+            cached = self.cache.get(model, temperature, system_instructions, content)
+            if cached is not None:
+                return cached
+
+        self._ensure_probed()
+        if not self.ollama_available or not self._aclient:
             return {
                 "modelDetermination": "ERROR",
                 "confidenceScore": 0,
                 "contextualInsights": "LLM service unavailable"
             }
+
+        if not self._llm_ready():
+            return {
+                "modelDetermination": "ERROR",
+                "confidenceScore": 0,
+                "contextualInsights": "LLM degraded"
+            }
         
-        generation_config = {
-            "temperature": max(0.0, min(1.0, temperature)),
-            "top_p": 0.9,
-            "top_k": 40,
-            "num_ctx": 8192,
-            "repeat_penalty": 1.2,
-            "stop": ["<end_of_turn>", "```", "\n\n"],
-            "system": system_instructions
-        }
-        
-            prompt = f"Classify this content per instructions:\n{content[:5000]}\nOutput JSON only:"
+        # Engine reads are already capped at MAX_CONTENT_CHARS; only direct
+        # callers passing longer text pay for a slice here
+        if len(content) > MAX_CONTENT_CHARS:
+            content = content[:MAX_CONTENT_CHARS]
+        prompt = f"Classify this content per instructions:\n{content}\nOutput JSON only:"
+        call_timeout = self._call_timeout(len(prompt) + len(system_instructions or ""))
+
+        try:
+            raw = self._chat(model, system_instructions, prompt, temperature, call_timeout)
+
+            payload = _extract_json_span(raw, "{", "}")
+            if payload is None:
+                raise ValueError(f"No valid JSON found in response: {raw[:200]}")
 
             try:
-                # Use thread-based timeout for Windows compatibility
-                result_container = {"result": None, "error": None}
-
-                def llm_call() -> None:
-                    """Invoke the Ollama chat API in a worker thread."""
-                    try:
-                        response = self.ollama.chat(
-                            model=model,
-                            messages=[
-                                {"role": "system", "content": system_instructions or ""},
-                                {"role": "user", "content": prompt},
-                            ],
-                            options=generation_config,
-                            stream=False,
-                        )
-                        result_container["result"] = response
-                    except Exception as exc:  # pragma: no cover - network errors
-                        result_container["error"] = exc
-
-                thread = threading.Thread(target=llm_call, daemon=True)
-                thread.start()
-                thread.join(timeout=self.timeout_seconds)
-
-                if thread.is_alive():
-                    logger.error("LLM call timed out")
-                    return {
-                        "modelDetermination": "ERROR",
-                        "confidenceScore": 0,
-                        "contextualInsights": (
-                            f"LLM call timed out after {self.timeout_seconds} seconds"
-                        ),
-                    }
-
-                if result_container["error"]:
-                    raise result_container["error"]
-
-                response = result_container["result"]
-                raw = (
-                    response.get("message", {}).get("content", "")
-                    if isinstance(response, dict)
-                    else str(response)
-                )
+                result = json.loads(payload)
+            except json.JSONDecodeError as exc:
+                raise ValueError(
+                    f"JSON decode error: {exc}\nExtracted: {payload[:200]}"
+                ) from exc
 
-                json_match = re.search(r"\{[^{}]*\}", raw, re.DOTALL)
-                if not json_match:
-                    raise ValueError(f"No valid JSON found in response: {raw[:200]}")
-
-                try:
-                    result = json.loads(json_match.group(0))
-                except json.JSONDecodeError as exc:
-                    raise ValueError(
-                        f"JSON decode error: {exc}\nExtracted: {json_match.group(0)[:200]}"
-                    ) from exc
-
-                validation_rules = {
-                    "modelDetermination": (
-                        lambda x: x in ("TRANSITORY", "DESTROY", "KEEP"),
-                        "must be TRANSITORY, DESTROY, or KEEP",
-                    ),
-                    "confidenceScore": (
-                        lambda x: isinstance(x, (int, float)) and 1 <= x <= 100,
-                        "must be number 1-100",
-                    ),
-                    "contextualInsights": (
-                        lambda x: isinstance(x, str),
-                        "must be string",
-                    ),
-                }
-
-                for key, (validator, msg) in validation_rules.items():
-                    if key not in result:
-                        raise ValueError(f"Missing required key: {key}")
-                    if not validator(result[key]):
-                        raise ValueError(f"Invalid {key}: {result[key]} ({msg})")
-
-                return result
+            self._validate_result(result)
 
+            if self.cache is not None:
+                self.cache.put(model, temperature, system_instructions, content, result)
+            return result
+
+        except asyncio.TimeoutError:
+            logger.error("LLM call timed out")
+            return {
+                "modelDetermination": "ERROR",
+                "confidenceScore": 0,
+                "contextualInsights": (
+                    f"LLM call timed out after {call_timeout:g} seconds"
+                ),
+            }
+        except Exception as e:
+            logger.error("LLM classification failed: %s", e)
+            return {
+                "modelDetermination": "ERROR",
+                "confidenceScore": 0,
+                "contextualInsights": f"Classification error: {str(e)[:200]}",
+            }
+
+    def classify_batch_with_llm(
+        self,
+        model: str,
+        system_instructions: str,
+        contents: List[str],
+        temperature: float = 0.1
+    ) -> List[Dict[str, Any]]:
+        """
+        Classify several snippets with a single prompt.
+
+        Cached snippets are answered from the cache; the rest share one
+        request that must return a JSON array of matching length. Any
+        malformed batch response falls back to per-item calls. Only items
+        sent in full are cached from a batch answer.
+        """
+        cache = self.cache
+        results: List[Optional[Dict[str, Any]]] = [
+            cache.get(model, temperature, system_instructions, content) if cache else None
+            for content in contents
+        ]
+        misses = [i for i, result in enumerate(results) if result is None]
+        if misses:
+            self._ensure_probed()
+
+        if len(misses) > 1 and self._llm_ready():
+            per_item = MAX_CONTENT_CHARS // len(misses)
+            items = "\n".join(
+                f"{n}) {contents[i][:per_item]}" for n, i in enumerate(misses, 1)
+            )
+            prompt = (
+                f"Return a JSON array of length {len(misses)}. For each item, output "
+                "{modelDetermination, confidenceScore, contextualInsights}. "
+                f"Items:\n{items}\nOutput JSON only:"
+            )
+            try:
+                raw = self._chat(
+                    model,
+                    system_instructions,
+                    prompt,
+                    temperature,
+                    expect="[]",
+                    num_predict=_GEN_CONFIG_BASE["num_predict"] * len(misses),
+                )
+                payload = _extract_json_span(raw, "[", "]")
+                if payload is None:
+                    raise ValueError(f"No JSON array found in response: {raw[:200]}")
+                batch = json.loads(payload)
+                if not isinstance(batch, list) or len(batch) != len(misses):
+                    raise ValueError(f"Expected {len(misses)} results in batch response")
+                for result in batch:
+                    self._validate_result(result)
             except Exception as e:
-                logger.error("LLM classification failed: %s", e)
-                return {
-                    "modelDetermination": "ERROR",
-                    "confidenceScore": 0,
-                    "contextualInsights": f"Classification error: {str(e)[:200]}",
-                }
+                logger.warning("Batch classification failed, retrying per item: %s", e)
+            else:
+                for i, result in zip(misses, batch):
+                    # An item cut to per_item was judged on partial text; caching
+                    # it under the full content would answer later single calls
+                    if cache is not None and len(contents[i]) <= per_item:
+                        cache.put(model, temperature, system_instructions, contents[i], result)
+                    results[i] = result
+                misses = []
+
+        for i in misses:
+            results[i] = self.classify_with_llm(
+                model, system_instructions, contents[i], temperature
+            )
+        return results
 
 class ClassificationEngine:
     """Main classification engine with hybrid scoring."""
+
+    RETENTION_SECONDS = 6 * 365 * 24 * 60 * 60
+    # How long a computed age threshold is reused before recomputing
+    THRESHOLD_REFRESH_SECONDS = 3600.0
     
-    def __init__(self, timeout_seconds: int = 30):
-        self.llm_engine = LLMEngine(timeout_seconds)
+    def __init__(
+        self,
+        timeout_seconds: int = 30,
+        cache: Optional[ResponseCache] = None,
+        throughput_tokens_per_sec: float = 30.0,
+        metadata_cache_size: int = 0
+    ):
+        self.llm_engine = LLMEngine(timeout_seconds, cache, throughput_tokens_per_sec)
+        self._threshold_cache: Optional[tuple] = None
+        # Off by default: a cached mtime would keep a file that was edited
+        # after its first classification looking old enough to DESTROY.
+        # Enable only for runs that see the same unchanged paths repeatedly.
+        if metadata_cache_size > 0:
+            self._stat_and_resolve = functools.lru_cache(maxsize=metadata_cache_size)(
+                self._stat_and_resolve
+            )
+
+    @staticmethod
+    def _stat_and_resolve(path_str: str) -> Tuple[str, os.stat_result]:
+        """Return the resolved path and stat result for ``path_str``."""
+        path = Path(path_str)
+        return str(path.resolve()), path.stat()
+
+    def invalidate(self, path: Optional[Union[str, Path]] = None) -> None:
+        """
+        Drop cached metadata so the next classification re-reads the disk.
+
+        With ``metadata_cache_size`` unset there is nothing to drop. The
+        cache is keyed by path string and ``functools.lru_cache`` cannot
+        evict one key, so any ``path`` clears the whole cache.
+        """
+        cache_clear = getattr(self._stat_and_resolve, "cache_clear", None)
+        if cache_clear is not None:
+            cache_clear()
+
+    def _threshold_epoch(self) -> float:
+        """Epoch seconds before which a file is older than six years (cached hourly)."""
+        now = time.monotonic()
+        cached = self._threshold_cache
+        if cached is None or now - cached[0] >= self.THRESHOLD_REFRESH_SECONDS:
+            cached = (now, time.time() - self.RETENTION_SECONDS)
+            self._threshold_cache = cached
+        return cached[1]
         
     def _hybrid_confidence(
         self, 
         llm_score: int, 
-        file_path: Path, 
+        mtime_ts: float, 
         content: str, 
         determination: str
     ) -> int:
@@ -233,9 +686,7 @@ class ClassificationEngine:
         """
         try:
             if determination == "DESTROY":
-                mtime = datetime.datetime.fromtimestamp(file_path.stat().st_mtime)
-                threshold = datetime.datetime.now() - datetime.timedelta(days=6 * 365)
-                if mtime < threshold:
+                if mtime_ts < self._threshold_epoch():
                     return 100
                 else:
                     return min(80, max(1, int(llm_score)))
@@ -246,16 +697,133 @@ class ClassificationEngine:
         except Exception:
             return min(100, max(1, int(llm_score)))
     
-    def _read_file_content(self, file_path: Path, max_lines: int = 100) -> str:
-        """Safely read file content with proper error handling."""
+    def _read_file_content(
+        self,
+        file_path: Path,
+        max_lines: int = 100,
+        size: Optional[int] = None,
+        max_chars: int = MAX_CONTENT_CHARS
+    ) -> str:
+        """Safely read file content with proper error handling.
+
+        Plain text is read as raw bytes in large chunks until ``max_lines``
+        newlines or enough bytes for ``max_chars`` are buffered, then decoded
+        once; within those bounds the result matches reading the first
+        ``max_lines`` lines in text mode. Office and PDF files are handed to
+        ``extract_file_content``. A known ``size`` of zero returns '' without
+        opening the file.
+        """
+        if size == 0 or max_lines <= 0:
+            return ''
+        if file_path.suffix.lower() in _EXTRACTED_EXT:
+            return extract_file_content(file_path, max_chars)
+        # UTF-8 needs at most four bytes per character
+        max_bytes = max_chars * 4
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = ''.join([next(f, '') for _ in range(max_lines)])
+            with open(file_path, 'rb') as f:
+                raw = f.read(_READ_CHUNK_BYTES)
+                while raw.count(b'\n') < max_lines and len(raw) < max_bytes:
+                    chunk = f.read(_READ_CHUNK_BYTES)
+                    if not chunk:
+                        break
+                    raw += chunk
+            content = raw.decode('utf-8', errors='ignore')
+            if '\r' in content:
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
+            lines = content.split('\n', max_lines)
+            if len(lines) > max_lines:
+                content = '\n'.join(lines[:max_lines]) + '\n'
+            if len(content) > max_chars:
+                content = content[:max_chars]
             return content
         except Exception as e:
             logger.warning(f"Could not read file {file_path}: {e}")
             return ''
     
+    def _make_result(
+        self,
+        file_path: Path,
+        full_path: str,
+        mtime: datetime.datetime,
+        size_kb: float,
+        determination: str,
+        confidence: int,
+        insights: str,
+        processing_time: float,
+        error_message: str = ""
+    ) -> ClassificationResult:
+        """Build a result from metadata gathered once per file."""
+        return ClassificationResult(
+            file_name=file_path.name,
+            extension=file_path.suffix,
+            full_path=full_path,
+            last_modified=mtime.isoformat(),
+            size_kb=size_kb,
+            model_determination=determination,
+            confidence_score=confidence,
+            contextual_insights=insights,
+            processing_time_ms=int(processing_time),
+            error_message=error_message
+        )
+    
+    def _llm_classification(
+        self,
+        file_path: Path,
+        full_path: str,
+        stat_info: os.stat_result,
+        content: str,
+        llm_result: Dict[str, Any],
+        processing_time: float
+    ) -> ClassificationResult:
+        """Build the result for a file the LLM classified, applying hybrid scoring."""
+        determination = llm_result.get('modelDetermination', 'ERROR')
+        confidence_score = self._hybrid_confidence(
+            llm_result.get('confidenceScore', 0),
+            stat_info.st_mtime,
+            content,
+            determination
+        )
+        return self._make_result(
+            file_path,
+            full_path,
+            datetime.datetime.fromtimestamp(stat_info.st_mtime),
+            round(stat_info.st_size / 1024, 2),
+            determination,
+            confidence_score,
+            llm_result.get('contextualInsights', ''),
+            processing_time
+        )
+
+    def _classify_locally(
+        self,
+        file_path: Path,
+        full_path: str,
+        stat_info: os.stat_result,
+        content: str,
+        start_time: float
+    ) -> Optional[ClassificationResult]:
+        """Return the result for a file settled without the LLM, else None."""
+        if not content.strip():
+            # Nothing for the LLM to read
+            determination, confidence, insights = "TRANSITORY", 0, "Empty file"
+        else:
+            # Surface cues settle some files without the LLM
+            rule = _preclassify(content)
+            if rule is None:
+                return None
+            determination, confidence, reason = rule
+            insights = f"Pre-rule: {reason}"
+        return self._make_result(
+            file_path,
+            full_path,
+            datetime.datetime.fromtimestamp(stat_info.st_mtime),
+            round(stat_info.st_size / 1024, 2),
+            determination,
+            confidence,
+            insights,
+            (time.perf_counter() - start_time) * 1000
+        )
+    
     def classify_file(
         self,
         file_path: Union[str, Path],
@@ -277,34 +845,36 @@ class ClassificationEngine:
         Returns:
             ClassificationResult with all metadata and classification
         """
-        start_time = datetime.datetime.now()
+        start_time = time.perf_counter()
         file_path = Path(file_path)
+        full_path = None
+        stat_info = None
         
         try:
-            # Get file metadata
-            stat_info = file_path.stat()
-            mtime = datetime.datetime.fromtimestamp(stat_info.st_mtime)
-            size_kb = round(stat_info.st_size / 1024, 2)
-            
-            # Read file content
-            content = self._read_file_content(file_path, max_lines)
+            # Get file metadata; every result below reuses these
+            full_path, stat_info = self._stat_and_resolve(str(file_path))
             
             # Check if file is old enough for automatic DESTROY classification
-            threshold = datetime.datetime.now() - datetime.timedelta(days=6 * 365)
-            if mtime < threshold:
-                # Automatic DESTROY for old files
-                processing_time = (datetime.datetime.now() - start_time).total_seconds() * 1000
-                return ClassificationResult(
-                    file_name=file_path.name,
-                    extension=file_path.suffix,
-                    full_path=str(file_path.resolve()),
-                    last_modified=mtime.isoformat(),
-                    size_kb=size_kb,
-                    model_determination="DESTROY",
-                    confidence_score=100,
-                    contextual_insights="Older than 6 years - automatic destroy",
-                    processing_time_ms=int(processing_time)
+            if stat_info.st_mtime < self._threshold_epoch():
+                return self._make_result(
+                    file_path,
+                    full_path,
+                    datetime.datetime.fromtimestamp(stat_info.st_mtime),
+                    round(stat_info.st_size / 1024, 2),
+                    "DESTROY",
+                    100,
+                    "Older than 6 years - automatic destroy",
+                    (time.perf_counter() - start_time) * 1000
                 )
+
+            # Read file content
+            content = self._read_file_content(file_path, max_lines, stat_info.st_size)
+
+            local_result = self._classify_locally(
+                file_path, full_path, stat_info, content, start_time
+            )
+            if local_result is not None:
+                return local_result
             
             # Use LLM for classification
             llm_result = self.llm_engine.classify_with_llm(
@@ -314,56 +884,118 @@ class ClassificationEngine:
                 temperature=temperature
             )
             
-            # Apply hybrid confidence scoring
-            confidence_score = self._hybrid_confidence(
-                llm_result.get('confidenceScore', 0),
-                file_path,
-                content,
-                llm_result.get('modelDetermination', 'ERROR')
-            )
-            
-            processing_time = (datetime.datetime.now() - start_time).total_seconds() * 1000
-            
-            return ClassificationResult(
-                file_name=file_path.name,
-                extension=file_path.suffix,
-                full_path=str(file_path.resolve()),
-                last_modified=mtime.isoformat(),
-                size_kb=size_kb,
-                model_determination=llm_result.get('modelDetermination', 'ERROR'),
-                confidence_score=confidence_score,
-                contextual_insights=llm_result.get('contextualInsights', ''),
-                processing_time_ms=int(processing_time)
+            processing_time = (time.perf_counter() - start_time) * 1000
+            return self._llm_classification(
+                file_path, full_path, stat_info, content, llm_result, processing_time
             )
             
         except Exception as e:
-            processing_time = (datetime.datetime.now() - start_time).total_seconds() * 1000
+            processing_time = (time.perf_counter() - start_time) * 1000
             logger.error(f"Failed to classify {file_path}: {e}")
             
-            # Return error result with as much metadata as possible
-            try:
-                stat_info = file_path.stat()
+            # Return error result with whatever metadata was gathered
+            if stat_info is not None:
                 mtime = datetime.datetime.fromtimestamp(stat_info.st_mtime)
                 size_kb = round(stat_info.st_size / 1024, 2)
-            except:
+            else:
                 mtime = datetime.datetime.now()
                 size_kb = 0
             
-            return ClassificationResult(
-                file_name=file_path.name,
-                extension=file_path.suffix,
-                full_path=str(file_path.resolve()),
-                last_modified=mtime.isoformat(),
-                size_kb=size_kb,
-                model_determination="ERROR",
-                confidence_score=0,
-                contextual_insights=f"Processing error: {str(e)[:200]}",
-                processing_time_ms=int(processing_time),
+            return self._make_result(
+                file_path,
+                full_path if full_path is not None else str(file_path.absolute()),
+                mtime,
+                size_kb,
+                "ERROR",
+                0,
+                f"Processing error: {str(e)[:200]}",
+                processing_time,
                 error_message=str(e)
             )
 
-# Create a global instance for backward compatibility
-_classification_engine = ClassificationEngine()
+    def classify_files(
+        self,
+        paths: List[Union[str, Path]],
+        model: str = 'llama2',
+        instructions: str = '',
+        temperature: float = 0.1,
+        max_lines: int = 100,
+        batch_size: int = 16
+    ) -> List[ClassificationResult]:
+        """
+        Classify many files, sharing one LLM request per ``batch_size`` files.
+
+        Files that never reach the LLM (unreadable metadata, automatic
+        DESTROY) go through ``classify_file`` unchanged. Results are returned
+        in the order of ``paths``.
+        """
+        if batch_size <= 1:
+            return [
+                self.classify_file(path, model, instructions, temperature, max_lines)
+                for path in paths
+            ]
+
+        results: List[Optional[ClassificationResult]] = [None] * len(paths)
+        pending = []
+        threshold_epoch = self._threshold_epoch()
+        for index, path in enumerate(paths):
+            path = Path(path)
+            try:
+                full_path, stat_info = self._stat_and_resolve(str(path))
+            except Exception:
+                # e.g. RuntimeError from resolve() on a symlink loop;
+                # classify_file turns it into an ERROR result
+                stat_info = None
+            if stat_info is None or stat_info.st_mtime < threshold_epoch:
+                results[index] = self.classify_file(
+                    path, model, instructions, temperature, max_lines
+                )
+                continue
+            start_time = time.perf_counter()
+            content = self._read_file_content(path, max_lines, stat_info.st_size)
+            local_result = self._classify_locally(
+                path, full_path, stat_info, content, start_time
+            )
+            if local_result is not None:
+                results[index] = local_result
+                continue
+            pending.append((index, path, full_path, stat_info, content))
+
+        for offset in range(0, len(pending), batch_size):
+            batch = pending[offset:offset + batch_size]
+            start_time = time.perf_counter()
+            contents = [content for *_, content in batch]
+            llm_results = self.llm_engine.classify_batch_with_llm(
+                model=model,
+                system_instructions=instructions,
+                contents=contents,
+                temperature=temperature
+            )
+            processing_time = (
+                (time.perf_counter() - start_time) * 1000 / len(batch)
+            )
+            for (index, path, full_path, stat_info, content), llm_result in zip(
+                batch, llm_results
+            ):
+                results[index] = self._llm_classification(
+                    path, full_path, stat_info, content, llm_result, processing_time
+                )
+
+        return results
+
+# Shared instance for the module-level helpers, created on first use so
+# importing this module costs nothing
+_default_engine: Optional[ClassificationEngine] = None
+_default_engine_lock = threading.Lock()
+
+def get_default_engine() -> ClassificationEngine:
+    """Return the process-wide ``ClassificationEngine``, creating it once."""
+    global _default_engine
+    if _default_engine is None:
+        with _default_engine_lock:
+            if _default_engine is None:
+                _default_engine = ClassificationEngine()
+    return _default_engine
 
 def process_file(
     file_path: Path,
@@ -375,7 +1007,7 @@ def process_file(
     """
     Legacy compatibility function that matches the original interface.
     """
-    result = _classification_engine.classify_file(
+    result = get_default_engine().classify_file(
         file_path=file_path,
         model=model,
         instructions=instructions,
@@ -383,14 +1015,56 @@ def process_file(
         max_lines=lines
     )
     
-    # Convert to original format
-    return {
-        'FileName': result.file_name,
-        'Extension': result.extension,
-        'FullPath': result.full_path,
-        'LastModified': result.last_modified,
-        'SizeKB': result.size_kb,
-        'ModelDetermination': result.model_determination,
-        'ConfidenceScore': result.confidence_score,
-        'ContextualInsights': result.contextual_insights
-    }
+    return _legacy_record(result)
+
+# Original ``process_file`` record keys and the result fields they come from
+_FIELD_MAP: Dict[str, str] = {
+    'FileName': 'file_name',
+    'Extension': 'extension',
+    'FullPath': 'full_path',
+    'LastModified': 'last_modified',
+    'SizeKB': 'size_kb',
+    'ModelDetermination': 'model_determination',
+    'ConfidenceScore': 'confidence_score',
+    'ContextualInsights': 'contextual_insights',
+}
+
+def _legacy_record(result: ClassificationResult) -> Dict[str, Any]:
+    """Convert a result to the original ``process_file`` dictionary format."""
+    return {key: getattr(result, attr) for key, attr in _FIELD_MAP.items()}
+
+def _default_load_threads() -> int:
+    """Worker count from ``PCRC_LOAD_THREADS``, else one less than the CPU count."""
+    env_threads = os.environ.get("PCRC_LOAD_THREADS")
+    if env_threads:
+        try:
+            return max(1, int(env_threads))
+        except ValueError:
+            logger.warning(f"Ignoring invalid PCRC_LOAD_THREADS={env_threads!r}")
+    return max(1, (os.cpu_count() or 2) - 1)
+
+def process_files(
+    paths: List[Path],
+    model: str,
+    instructions: str,
+    temperature: float,
+    lines: int,
+    max_workers: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Classify many files concurrently, returning ``process_file`` records in order.
+
+    File reads and Ollama requests overlap across a thread pool. Corpora on
+    rotating disks should pass ``max_workers=1`` (or set
+    ``PCRC_LOAD_THREADS=1``) to avoid seek thrash.
+    """
+    if max_workers is None:
+        max_workers = _default_load_threads()
+
+    def classify(path: Path) -> Dict[str, Any]:
+        return process_file(path, model, instructions, temperature, lines)
+
+    if max_workers <= 1 or len(paths) <= 1:
+        return [classify(path) for path in paths]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(classify, paths))
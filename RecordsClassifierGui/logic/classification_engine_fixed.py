@@ -8,15 +8,28 @@ and graceful fallback when LLM services are unavailable.
 
 # COPILOT AGENT: LLM MUST BE BYPASSED IF RUN MODE IS "Last Modified". IMPLEMENT THIS LOGIC HERE OR IN file_scanner.py
 
+import contextlib
+import functools
+import itertools
 import json
+import os
+import queue
 import re
 import datetime
 import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, List, Set, Optional, Union, Iterator
 from dataclasses import dataclass
 import logging
 
+# Optional C accelerator for counting Schedule 6 keywords in one pass
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Import file_scanner with absolute import
 try:
     from RecordsClassifierGui.logic.file_scanner import FileScanner
@@ -101,7 +114,36 @@ EXCLUDE_EXT: Set[str] = frozenset(
 )
 
 
-@dataclass
+# One lookup per file decides include vs. skip. Exclusions are applied
+# last so they win for extensions present in both sets (e.g. ".log").
+_INCLUDE = "include"
+_EXT_DISPOSITION: Dict[str, str] = dict.fromkeys(INCLUDE_EXT, _INCLUDE)
+_EXT_DISPOSITION.update(dict.fromkeys(EXCLUDE_EXT, "Excluded"))
+
+
+# Bytes read per call when sampling file content
+_READ_CHUNK_BYTES = 64 * 1024
+# Upper bound on bytes sampled per file, for files with very long lines
+_MAX_READ_BYTES = 1024 * 1024
+
+
+def _full_path(file_path: Path, resolve_symlinks: bool = True) -> str:
+    """Return the absolute path reported in results."""
+    if resolve_symlinks:
+        return str(file_path.resolve())
+    return os.path.abspath(file_path)
+
+
+# Retention years are counted as 365-day years, as elsewhere in the tool
+_SECONDS_PER_YEAR = 365 * 86400
+
+
+def destroy_threshold_epoch(threshold_years: int) -> float:
+    """Return the epoch time before which files are automatically DESTROY."""
+    return time.time() - threshold_years * _SECONDS_PER_YEAR
+
+
+@dataclass(slots=True, frozen=True)
 class ClassificationResult:
     """Structured result from file classification."""
 
@@ -136,6 +178,52 @@ class LLMEngine:
         self.timeout_seconds = timeout_seconds
         self.ollama_available = False
         self.ollama = None
+        # Keywords are matched against lowercased content, so normalize
+        # them once here rather than trusting the schedule's casing.
+        self._kw_by_label: Dict[str, tuple] = {
+            label: tuple(kw.lower() for kw in keywords)
+            for label, keywords in model_output_validation.SCHEDULE_6_KEYWORDS.items()
+        }
+        self._labels_by_keyword: Dict[str, tuple] = {}
+        for label, keywords in self._kw_by_label.items():
+            for kw in keywords:
+                self._labels_by_keyword[kw] = self._labels_by_keyword.get(kw, ()) + (label,)
+        self._keyword_automaton = self._build_keyword_automaton()
+        self._min_keyword_len = min(map(len, self._labels_by_keyword), default=0)
+
+    def _build_keyword_automaton(self):
+        """Compile every Schedule 6 keyword into one Aho-Corasick automaton.
+
+        Returns None when pyahocorasick is not installed.
+        """
+        if ahocorasick is None:
+            return None
+        automaton = ahocorasick.Automaton()
+        for kw in self._labels_by_keyword:
+            automaton.add_word(kw, kw)
+        automaton.make_automaton()
+        return automaton
+
+    def _count_keywords(self, text: str) -> Dict[str, int]:
+        """Return ``text.count(kw)`` for every Schedule 6 keyword present.
+
+        Uses a single pass of the automaton when available. Overlapping
+        repeats of the same keyword are skipped, as ``str.count`` does.
+        """
+        counts: Dict[str, int] = {}
+        if self._keyword_automaton is None:
+            for kw in self._labels_by_keyword:
+                n = text.count(kw)
+                if n:
+                    counts[kw] = n
+            return counts
+        last_end: Dict[str, int] = {}
+        for end, kw in self._keyword_automaton.iter(text):
+            if end - len(kw) < last_end.get(kw, -1):
+                continue
+            last_end[kw] = end
+            counts[kw] = counts.get(kw, 0) + 1
+        return counts
 
     def _initialize_ollama(self) -> None:
         """Initialize real LLM clients when available."""
@@ -146,17 +234,30 @@ class LLMEngine:
         snippet = text.replace("\n", " ").strip()
         if not snippet:
             return "[File is binary or unreadable]"
-        printable = sum(1 for ch in snippet if ch.isprintable())
-        if printable / len(snippet) < 0.85:
-            return "[File is binary or unreadable]"
+        # str.isprintable() checks the whole snippet in C; only count
+        # characters when something in it is not printable.
+        if not snippet.isprintable():
+            printable = sum(1 for ch in snippet if ch.isprintable())
+            if printable / len(snippet) < 0.85:
+                return "[File is binary or unreadable]"
         return snippet[:80]
 
-    def _extract_snippet(self, content: str, keyword: str, window: int = 80) -> str:
-        """Return sanitized text snippet around a keyword or start of content."""
+    def _extract_snippet(
+        self,
+        content: str,
+        keyword: str,
+        window: int = 80,
+        lower_content: Optional[str] = None,
+    ) -> str:
+        """Return sanitized text snippet around a keyword or start of content.
+
+        ``lower_content`` may be passed when the caller already has
+        ``content.lower()``, to avoid lowercasing the content again.
+        """
         try:
             snippet = content[:window]
             if keyword:
-                lower = content.lower()
+                lower = content.lower() if lower_content is None else lower_content
                 idx = lower.find(keyword.lower())
                 if idx != -1:
                     start = max(0, idx - window // 2)
@@ -165,6 +266,30 @@ class LLMEngine:
         except Exception:
             return "[File is binary or unreadable]"
 
+    def _may_contain_keywords(self, content: str) -> bool:
+        """Return False when ``content`` cannot hold any Schedule 6 keyword.
+
+        Blank content, and ASCII content shorter than the shortest keyword,
+        skip the lowercase and scan. The length test is restricted to ASCII
+        because lowercasing some other characters lengthens the text.
+        """
+        if not content or content.isspace():
+            return False
+        return not (content.isascii() and len(content) < self._min_keyword_len)
+
+    def _score_labels(self, counts: Dict[str, int]) -> Dict[str, int]:
+        """Sum keyword counts per label, in SCHEDULE_6_KEYWORDS order.
+
+        Only keywords that were found are visited, so the cost follows the
+        number of hits rather than the size of the schedule.
+        """
+        label_counts = dict.fromkeys(self._kw_by_label, 0)
+        labels_by_keyword = self._labels_by_keyword
+        for kw, n in counts.items():
+            for label in labels_by_keyword.get(kw, ()):
+                label_counts[label] += n
+        return label_counts
+
     def classify_with_llm(
         self,
         model: str,
@@ -179,16 +304,13 @@ class LLMEngine:
         """
 
         try:
-            text = content.lower()
-
             # Count keyword occurrences for each Schedule 6 class
-            keyword_counts = {
-                label: sum(
-                    text.count(kw)
-                    for kw in model_output_validation.SCHEDULE_6_KEYWORDS.get(label, [])
-                )
-                for label in model_output_validation.SCHEDULE_6_KEYWORDS
-            }
+            if self._may_contain_keywords(content):
+                text = content.lower()
+                counts = self._count_keywords(text)
+            else:
+                text, counts = "", {}
+            keyword_counts = self._score_labels(counts)
 
             total = sum(keyword_counts.values())
             if total > 0:
@@ -196,14 +318,14 @@ class LLMEngine:
                 first_match = next(
                     (
                         kw
-                        for kw in model_output_validation.SCHEDULE_6_KEYWORDS[best_label]
-                        if kw in text
+                        for kw in self._kw_by_label[best_label]
+                        if kw in counts
                     ),
                     "",
                 )
                 determination = "KEEP" if best_label == "OFFICIAL" else best_label
                 base_conf = 50 + min(keyword_counts[best_label] * 10, 40)
-                snippet = self._extract_snippet(content, first_match)
+                snippet = self._extract_snippet(content, first_match, lower_content=text)
                 insights = (
                     f"The file includes the keyword '{first_match}', indicating a {determination.lower()} record."
                     f" Example text: '{snippet}'."
@@ -255,18 +377,19 @@ class ClassificationEngine:
     def _hybrid_confidence(
         self,
         llm_score: int,
-        file_path: Path,
-        content: str,
+        has_content: bool,
         determination: str,
-        threshold_years: int,
+        mtime_ts: float,
+        threshold_epoch: float,
     ) -> int:
         """Calculate hybrid confidence score combining LLM and rule-based logic.
 
         Args:
             llm_score: Confidence score from LLM (1-100).
-            file_path: Path to the file being classified.
-            content: File content that was classified.
+            has_content: Whether the classified content has any non-blank text.
             determination: Classification result from LLM.
+            mtime_ts: Modification time of the file, as already stat'ed.
+            threshold_epoch: Epoch time before which files are DESTROY.
 
         Returns:
             Adjusted confidence score (1-100) based on hybrid logic:
@@ -276,27 +399,52 @@ class ClassificationEngine:
             - Other classifications: use LLM score with bounds checking
         """
         try:
-            if determination == "DESTROY":
-                mtime = datetime.datetime.fromtimestamp(file_path.stat().st_mtime)
-                threshold = datetime.datetime.now() - datetime.timedelta(
-                    days=threshold_years * 365
-                )
-                if mtime < threshold:
-                    return 100
-                else:
-                    return min(80, max(1, int(llm_score)))
-            elif not content.strip():
-                return 0
-            else:
-                return min(100, max(1, int(llm_score)))
+            if determination != "DESTROY":
+                return min(100, max(1, int(llm_score))) if has_content else 0
+            if mtime_ts < threshold_epoch:
+                return 100
+            return min(80, max(1, int(llm_score)))
         except Exception:
             return min(100, max(1, int(llm_score)))
 
-    def _read_file_content(self, file_path: Path, max_lines: int = 100) -> str:
-        """Safely read file content with proper error handling."""
+    def _read_file_content(
+        self, file_path: Path, max_lines: int = 100, size: Optional[int] = None
+    ) -> str:
+        """Safely read file content with proper error handling.
+
+        Reads raw bytes in large chunks until ``max_lines`` line breaks or
+        ``_MAX_READ_BYTES`` are buffered, then decodes once. Within that
+        bound the result matches reading the first ``max_lines`` lines in
+        text mode (UTF-8, errors ignored, universal newlines). ``size`` is
+        the known file size; empty files are not opened.
+        """
+        if size == 0 or max_lines <= 0:
+            return ""
         try:
-            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                content = "".join([next(f, "") for _ in range(max_lines)])
+            chunks: List[bytes] = []
+            line_breaks = 0
+            total = 0
+            ends_with_cr = False
+            with open(file_path, "rb") as f:
+                while line_breaks < max_lines and total < _MAX_READ_BYTES:
+                    chunk = f.read(_READ_CHUNK_BYTES)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+                    total += len(chunk)
+                    # Universal newlines: "\n", "\r\n" and a lone "\r" each end a line
+                    line_breaks += (
+                        chunk.count(b"\n") + chunk.count(b"\r") - chunk.count(b"\r\n")
+                    )
+                    if ends_with_cr and chunk[:1] == b"\n":
+                        line_breaks -= 1  # "\r\n" split across two reads
+                    ends_with_cr = chunk[-1:] == b"\r"
+            content = b"".join(chunks).decode("utf-8", errors="ignore")
+            if "\r" in content:
+                content = content.replace("\r\n", "\n").replace("\r", "\n")
+            lines = content.split("\n", max_lines)
+            if len(lines) > max_lines:
+                content = "\n".join(lines[:max_lines]) + "\n"
             return content
         except Exception as e:
             logger.warning(f"Could not read file {file_path}: {e}")
@@ -311,6 +459,9 @@ class ClassificationEngine:
         max_lines: int = 100,
         run_mode: str = "Classification",
         threshold_years: int = 6,
+        threshold_epoch: Optional[float] = None,
+        stat_info: Optional[os.stat_result] = None,
+        resolve_symlinks: bool = True,
     ) -> ClassificationResult:
         """
         Classify a single file with comprehensive error handling.
@@ -323,112 +474,87 @@ class ClassificationEngine:
             max_lines: Maximum lines to read from file
             run_mode: Classification mode ('Classification' or 'Last Modified')
             threshold_years: Age threshold in years for automatic DESTROY logic
+            threshold_epoch: Precomputed ``destroy_threshold_epoch(threshold_years)``;
+                files modified before it are DESTROY. Computed if omitted.
+            stat_info: Stat result already collected for ``file_path`` (for
+                example by ``FileScanner``); the file is stat'ed if omitted.
+            resolve_symlinks: Report ``full_path`` with symlinks resolved.
+                ``False`` uses ``os.path.abspath``, which is pure string work
+                and avoids a syscall per path component.
 
         Returns:
             ClassificationResult with all metadata and classification
         """
-        start_time = datetime.datetime.now()
-        file_path = Path(file_path)
+        start_ns = time.perf_counter_ns()
+        # Re-wrapping an existing Path re-parses it; only wrap plain strings
+        if not isinstance(file_path, Path):
+            file_path = Path(file_path)
+        full_path = None
+        mtime = None
+
+        def make_result(
+            extension: str,
+            determination: str,
+            confidence: int,
+            insights: str,
+            status: str,
+            error_message: str = "",
+        ) -> ClassificationResult:
+            # Shared fields come from the metadata gathered below
+            return ClassificationResult(
+                file_name=file_path.name,
+                extension=extension,
+                full_path=full_path,
+                last_modified=mtime.isoformat(),
+                size_kb=size_kb,
+                model_determination=determination,
+                confidence_score=confidence,
+                contextual_insights=insights,
+                status=status,
+                processing_time_ms=(time.perf_counter_ns() - start_ns) // 1_000_000,
+                error_message=error_message,
+            )
 
         try:
             # Get file metadata
-            stat_info = file_path.stat()
+            if stat_info is None:
+                stat_info = file_path.stat()
             mtime = datetime.datetime.fromtimestamp(stat_info.st_mtime)
             size_kb = round(stat_info.st_size / 1024, 2)
+            full_path = _full_path(file_path, resolve_symlinks)
 
             extension = file_path.suffix.lower()
 
-            # Calculate destroy threshold once
-            threshold = datetime.datetime.now() - datetime.timedelta(
-                days=threshold_years * 365
-            )
+            if threshold_epoch is None:
+                threshold_epoch = destroy_threshold_epoch(threshold_years)
+            is_past_threshold = stat_info.st_mtime < threshold_epoch
 
+            # Rules that decide the result without reading the file, in order.
             # Rule 1: Any file older than the threshold is DESTROY regardless of other checks
-            if mtime < threshold:
-                processing_time = (
-                    datetime.datetime.now() - start_time
-                ).total_seconds() * 1000
-                return ClassificationResult(
-                    file_name=file_path.name,
-                    extension=extension,
-                    full_path=str(file_path.resolve()),
-                    last_modified=mtime.isoformat(),
-                    size_kb=size_kb,
-                    model_determination="DESTROY",
-                    confidence_score=100,
-                    contextual_insights=f"Older than {threshold_years} years - automatic destroy",
-                    status="success",
-                    processing_time_ms=int(processing_time),
-                )
-
-            # Check for excluded file extensions
-            if extension in EXCLUDE_EXT:
-                processing_time = (
-                    datetime.datetime.now() - start_time
-                ).total_seconds() * 1000
-                return ClassificationResult(
-                    file_name=file_path.name,
-                    extension=extension,
-                    full_path=str(file_path.resolve()),
-                    last_modified=mtime.isoformat(),
-                    size_kb=size_kb,
-                    model_determination="NA",
-                    confidence_score=100,
-                    contextual_insights=f"Excluded file type: {extension}",
-                    status="skipped",
-                    processing_time_ms=int(processing_time),
-                )
-
-            # Check if file extension is not in include list
-            if extension not in INCLUDE_EXT:
-                processing_time = (
-                    datetime.datetime.now() - start_time
-                ).total_seconds() * 1000
-                return ClassificationResult(
-                    file_name=file_path.name,
-                    extension=extension,
-                    full_path=str(file_path.resolve()),
-                    last_modified=mtime.isoformat(),
-                    size_kb=size_kb,
-                    model_determination="NA",
-                    confidence_score=100,
-                    contextual_insights=f"Unsupported file type: {extension}",
-                    status="skipped",
-                    processing_time_ms=int(processing_time),
+            disposition = _EXT_DISPOSITION.get(extension, "Unsupported")
+            if is_past_threshold:
+                rule = (
+                    "DESTROY",
+                    f"Older than {threshold_years} years - automatic destroy",
+                    "success",
                 )
+            # Skip excluded and unsupported file extensions
+            elif disposition != _INCLUDE:
+                rule = ("NA", f"{disposition} file type: {extension}", "skipped")
+            # "Last Modified" mode never reads content; old files were handled above
+            elif run_mode == "Last Modified":
+                rule = ("NA", f"File newer than {threshold_years} years", "skipped")
+            else:
+                rule = None
 
-            if run_mode == "Last Modified":
-                processing_time = (
-                    datetime.datetime.now() - start_time
-                ).total_seconds() * 1000
-                if mtime < threshold:
-                    return ClassificationResult(
-                        file_name=file_path.name,
-                        extension=extension,
-                        full_path=str(file_path.resolve()),
-                        last_modified=mtime.isoformat(),
-                        size_kb=size_kb,
-                        model_determination="DESTROY",
-                        confidence_score=100,
-                        contextual_insights=f"Older than {threshold_years} years - automatic destroy",
-                        status="success",
-                        processing_time_ms=int(processing_time),
-                    )
-                return ClassificationResult(
-                    file_name=file_path.name,
-                    extension=extension,
-                    full_path=str(file_path.resolve()),
-                    last_modified=mtime.isoformat(),
-                    size_kb=size_kb,
-                    model_determination="NA",
-                    confidence_score=100,
-                    contextual_insights=f"File newer than {threshold_years} years",
-                    status="skipped",
-                    processing_time_ms=int(processing_time),
-                )
+            if rule is not None:
+                determination, insights, status = rule
+                return make_result(extension, determination, 100, insights, status)
 
             # Read file content
-            content = self._read_file_content(file_path, max_lines)
+            content = self._read_file_content(
+                file_path, max_lines, size=stat_info.st_size
+            )
 
 
             # Use LLM for classification
@@ -442,64 +568,59 @@ class ClassificationEngine:
             # Apply hybrid confidence scoring
             confidence_score = self._hybrid_confidence(
                 llm_result.get("confidenceScore", 0),
-                file_path,
-                content,
+                bool(content) and not content.isspace(),
                 llm_result.get("modelDetermination", "ERROR"),
-                threshold_years,
+                stat_info.st_mtime,
+                threshold_epoch,
             )
 
-            processing_time = (
-                datetime.datetime.now() - start_time
-            ).total_seconds() * 1000
-
-            return ClassificationResult(
-                file_name=file_path.name,
-                extension=file_path.suffix,
-                full_path=str(file_path.resolve()),
-                last_modified=mtime.isoformat(),
-                size_kb=size_kb,
-                model_determination=llm_result.get("modelDetermination", "TRANSITORY"),
-                confidence_score=confidence_score,
-                contextual_insights=llm_result.get("contextualInsights", ""),
-                status="success",
-                processing_time_ms=int(processing_time),
+            return make_result(
+                file_path.suffix,
+                llm_result.get("modelDetermination", "TRANSITORY"),
+                confidence_score,
+                llm_result.get("contextualInsights", ""),
+                "success",
             )
 
         except Exception as e:
-            processing_time = (
-                datetime.datetime.now() - start_time
-            ).total_seconds() * 1000
             logger.error("Failed to classify %s: %s", file_path, e)
             msg = str(e)
             if "await" in msg and "expression" in msg:
                 msg += " - asynchronous call failed"
 
-            # Return error result with as much metadata as possible
-            try:
-                stat_info = file_path.stat()
-                mtime = datetime.datetime.fromtimestamp(stat_info.st_mtime)
-                size_kb = round(stat_info.st_size / 1024, 2)
-            except:
+            # Return error result with as much metadata as possible,
+            # reusing whatever the try block already looked up. A failed stat
+            # is not retried; the file's metadata is simply unavailable.
+            if mtime is None:
                 mtime = datetime.datetime.now()
                 size_kb = 0
-
-            return ClassificationResult(
-                file_name=file_path.name,
-                extension=file_path.suffix,
-                full_path=str(file_path.resolve()),
-                last_modified=mtime.isoformat(),
-                size_kb=size_kb,
-                model_determination="NA",
-                confidence_score=0,
-                contextual_insights=f"Processing error: {msg[:200]}",
-                status="error",
-                processing_time_ms=int(processing_time),
+            if full_path is None:
+                full_path = _full_path(file_path, resolve_symlinks)
+
+            return make_result(
+                file_path.suffix,
+                "NA",
+                0,
+                f"Processing error: {msg[:200]}",
+                "error",
                 error_message=msg,
             )
 
 
-# Create a global instance for backward compatibility
-_classification_engine = ClassificationEngine()
+# Shared engine for the module-level helpers, created on first use so that
+# importing this module (or starting a pool worker) does not build it.
+_default_engine: Optional[ClassificationEngine] = None
+_default_engine_lock = threading.Lock()
+
+
+def get_default_engine() -> ClassificationEngine:
+    """Return the process-wide ``ClassificationEngine``, creating it once."""
+    global _default_engine
+    if _default_engine is None:
+        with _default_engine_lock:
+            if _default_engine is None:
+                _default_engine = ClassificationEngine()
+    return _default_engine
 
 
 def process_file(
@@ -526,7 +647,7 @@ def process_file(
     Returns:
         Dictionary with classification results in the original format
     """
-    result = _classification_engine.classify_file(
+    result = get_default_engine().classify_file(
         file_path=file_path,
         model=model,
         instructions=instructions,
@@ -550,11 +671,82 @@ def process_file(
     }
 
 
+# Directories with fewer supported files than this are classified in-process;
+# for them, starting a process pool costs more than it saves.
+PARALLEL_MIN_FILES = 64
+
+_worker_engine: ClassificationEngine | None = None
+
+
+def _init_worker(engine: ClassificationEngine | None = None) -> None:
+    """Set up a pool worker's engine once so tasks only carry a path.
+
+    Without an explicit engine the worker builds its own default engine
+    instead of unpickling the parent's.
+    """
+    global _worker_engine
+    _worker_engine = engine if engine is not None else get_default_engine()
+
+
+def _classify_one(
+    item: tuple[Path, Optional[os.stat_result]], kwargs: Dict[str, Any]
+) -> ClassificationResult:
+    """Classify one scanned file with the worker's engine (picklable pool task)."""
+    path, stat_info = item
+    return _worker_engine.classify_file(path, stat_info=stat_info, **kwargs)
+
+
+_PREFETCH_DONE = object()
+
+
+def _prefetch(iterable: Iterator[Any], maxsize: int = 64) -> Iterator[Any]:
+    """Yield items from ``iterable`` while a background thread runs ahead.
+
+    ``classify_directory`` uses this so the directory walk and its stat
+    calls overlap with classification instead of alternating with it.
+    Exceptions raised by ``iterable`` are re-raised in the caller.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize)
+    stop = threading.Event()
+
+    def put(entry) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce() -> None:
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+        except Exception as exc:
+            put((_PREFETCH_DONE, exc))
+        else:
+            put((_PREFETCH_DONE, None))
+
+    threading.Thread(target=produce, name="scan-prefetch", daemon=True).start()
+    try:
+        while True:
+            item, exc = buffer.get()
+            if item is _PREFETCH_DONE:
+                if exc is not None:
+                    raise exc
+                return
+            yield item
+    finally:
+        stop.set()
+
+
 def classify_directory(
     directory: Path,
     *,
     batch_size: int = 50,
     engine: ClassificationEngine | None = None,
+    max_workers: int | None = None,
     **kwargs,
 ) -> Iterator[ClassificationResult]:
     """Yield ``ClassificationResult`` objects for all files in ``directory``.
@@ -566,33 +758,69 @@ def classify_directory(
     batch_size : int, optional
         Number of files to process between log updates.
     engine : ClassificationEngine, optional
-        Engine instance to use. A new one is created if omitted.
+        Engine instance to use. ``get_default_engine()`` is used if omitted;
+        pool workers then build their own default engine.
+    max_workers : int, optional
+        Worker processes used once the directory holds at least
+        ``PARALLEL_MIN_FILES`` files. The pool is opt-in: ``None`` (the
+        default) and ``1`` classify in-process, because spawned workers
+        relaunch a frozen (PyInstaller) executable unless its entry point
+        calls ``multiprocessing.freeze_support()``.
     **kwargs : Any
         Additional arguments passed to ``ClassificationEngine.classify_file``.
 
     Yields
     ------
     ClassificationResult
-        Result for each processed file.
+        Result for each processed file, in scan order.
     """
 
-    engine = engine or _classification_engine
+    custom_engine = engine
+    engine = engine or get_default_engine()
+    # One destroy threshold for the whole sweep instead of one per file
+    kwargs.setdefault(
+        "threshold_epoch", destroy_threshold_epoch(kwargs.get("threshold_years", 6))
+    )
     scanner = FileScanner()
-    processed = 0
-    batch: list[Path] = []
-    for file_info in scanner.scan_directory(directory):
-        if file_info.category == "skip":
-            continue
-        batch.append(file_info.path)
-        if len(batch) >= batch_size:
-            for path in batch:
-                yield engine.classify_file(path, **kwargs)
+    # Scanned files with the stat the scanner already took, so
+    # classify_file does not stat them again
+    items = _prefetch(
+        (file_info.path, file_info.stat)
+        for file_info in scanner.scan_directory(directory)
+        if file_info.category != "skip"
+    )
+    head = list(itertools.islice(items, PARALLEL_MIN_FILES))
+    parallel = (max_workers or 1) > 1 and len(head) >= PARALLEL_MIN_FILES
+    items = itertools.chain(head, items)
+
+    with contextlib.ExitStack() as stack:
+        if parallel:
+            pool = stack.enter_context(
+                ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_init_worker,
+                    initargs=(custom_engine,),
+                )
+            )
+            task = functools.partial(_classify_one, kwargs=kwargs)
+
+            def classify_batch(batch):
+                return pool.map(task, batch, chunksize=8)
+
+        else:
+
+            def classify_batch(batch):
+                return (
+                    engine.classify_file(path, stat_info=stat_info, **kwargs)
+                    for path, stat_info in batch
+                )
+
+        processed = 0
+        while True:
+            batch = list(itertools.islice(items, batch_size))
+            if not batch:
+                break
+            for result in classify_batch(batch):
+                yield result
                 processed += 1
             logger.info("Processed %s files", processed)
-            batch.clear()
-
-    for path in batch:
-        yield engine.classify_file(path, **kwargs)
-        processed += 1
-    if processed:
-        logger.info("Processed %s files", processed)
@@ -0,0 +1,239 @@
+"""
+Persistent response cache for LLM classifications.
+
+Results are stored as content-addressed JSON files so identical snippets
+(boilerplate headers, templates, copies) never reach the model twice.
+
+Disk caching is opt-in because entries are derived from county records:
+set ``PCRC_CACHE_DIR`` to enable it. Each cache directory is kept under
+``PCRC_CACHE_MAX_MB`` megabytes of disk space (default 256) by evicting
+the least recently used entries.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_MB = 256
+
+# Only this much content is sent to the model, so only this much is keyed.
+CACHE_CONTENT_CHARS = 5000
+
+# Eviction trims a full cache to this fraction of its bound, so the scan
+# it needs runs once per ~10% of capacity written rather than every write
+PRUNE_TARGET_RATIO = 0.9
+
+# Allocation unit assumed where stat() reports no block count (Windows)
+_CLUSTER_BYTES = 4096
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8", errors="surrogatepass")).hexdigest()
+
+
+def cache_dir_from_env(subdir: str) -> Optional[Path]:
+    """Return ``PCRC_CACHE_DIR/<subdir>``, or None when disk caching is off."""
+    root = os.environ.get("PCRC_CACHE_DIR")
+    return Path(root) / subdir if root else None
+
+
+def max_bytes_from_env() -> int:
+    """Return the per-directory size bound from ``PCRC_CACHE_MAX_MB``."""
+    value = os.environ.get("PCRC_CACHE_MAX_MB")
+    if value:
+        try:
+            return max(0, int(float(value) * 1024 * 1024))
+        except ValueError:
+            logger.warning(f"Ignoring invalid PCRC_CACHE_MAX_MB={value!r}")
+    return DEFAULT_MAX_MB * 1024 * 1024
+
+
+def _disk_usage(st: os.stat_result) -> int:
+    """Bytes a file occupies on disk, not its logical size: small entries
+    still fill whole blocks."""
+    blocks = getattr(st, "st_blocks", None)
+    if blocks is not None:
+        return blocks * 512
+    return -(-st.st_size // _CLUSTER_BYTES) * _CLUSTER_BYTES
+
+
+def _scan_cache_dir(root: Union[str, Path]) -> Tuple[List[Tuple[float, int, str]], int]:
+    """Return ``(mtime, disk usage, path)`` for every entry under ``root`` and
+    their total usage. In-flight ``.tmp`` files are skipped."""
+    entries = []
+    total = 0
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for name in filenames:
+            if name.endswith(".tmp"):
+                continue
+            path = os.path.join(dirpath, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            usage = _disk_usage(st)
+            entries.append((st.st_mtime, usage, path))
+            total += usage
+    return entries, total
+
+
+def prune_cache_dir(root: Union[str, Path], max_bytes: int) -> Tuple[int, int]:
+    """Delete the least recently used files under ``root`` until they occupy
+    at most ``max_bytes`` on disk. Returns ``(files removed, bytes left)``."""
+    entries, total = _scan_cache_dir(root)
+    if total <= max_bytes:
+        return 0, total
+    removed = 0
+    entries.sort()
+    for _mtime, usage, path in entries:
+        if total <= max_bytes:
+            break
+        try:
+            os.unlink(path)
+        except OSError:
+            continue
+        total -= usage
+        removed += 1
+    logger.info(f"Pruned {removed} cache entries under {root}")
+    return removed, total
+
+
+class SizeBoundedDir:
+    """Keeps a cache directory's disk usage under ``max_bytes``.
+
+    The tree is scanned once, on the first write, to learn its usage; after
+    that a running total follows every write and eviction. Only exceeding
+    the bound scans again, evicting least recently used entries down to
+    ``PRUNE_TARGET_RATIO`` of it.
+    """
+
+    def __init__(self, root: Union[str, Path], max_bytes: Optional[int] = None):
+        self.root = Path(root)
+        self.max_bytes = max_bytes_from_env() if max_bytes is None else max_bytes
+        self._total: Optional[int] = None
+        self._pruning = False
+        self._lock = threading.Lock()
+
+    def commit(self, tmp_name: str, path: Union[str, Path]) -> None:
+        """Move a finished temp file onto ``path`` and account for its size."""
+        try:
+            old = _disk_usage(os.stat(path))
+        except OSError:
+            old = 0
+        os.replace(tmp_name, path)
+        try:
+            new = _disk_usage(os.stat(path))
+        except OSError:
+            new = 0
+        with self._lock:
+            if self._total is None:
+                self._total = _scan_cache_dir(self.root)[1]
+            else:
+                self._total += new - old
+            due = self._total > self.max_bytes and not self._pruning
+            if due:
+                self._pruning = True
+        if not due:
+            return
+        try:
+            _removed, left = prune_cache_dir(
+                self.root, int(self.max_bytes * PRUNE_TARGET_RATIO)
+            )
+            with self._lock:
+                # Writes racing the scan may be missed until the next one
+                self._total = left
+        except OSError as e:
+            logger.warning(f"Could not prune cache {self.root}: {e}")
+        finally:
+            with self._lock:
+                self._pruning = False
+
+
+class ResponseCache:
+    """Exact-match on-disk cache of ``classify_with_llm`` results.
+
+    Entries live under ``<root>/<schema>/<key[:2]>/<key>.json`` where the
+    schema is a hash of model and instructions, so changing either starts
+    a fresh namespace instead of serving stale answers. Reads refresh an
+    entry's mtime, and the directory is pruned to ``max_bytes`` (default
+    from ``PCRC_CACHE_MAX_MB``) least recently used first.
+    """
+
+    def __init__(self, root: Union[str, Path], max_bytes: Optional[int] = None):
+        self.root = Path(root)
+        self._bound = SizeBoundedDir(self.root, max_bytes)
+
+    @classmethod
+    def from_env(cls) -> Optional["ResponseCache"]:
+        """Return a cache under ``PCRC_CACHE_DIR/llm``, or None if it is unset."""
+        root = cache_dir_from_env("llm")
+        return cls(root) if root is not None else None
+
+    @staticmethod
+    def make_key(model: str, temperature: float, system_instructions: str, content: str) -> str:
+        """Return the cache key for one classification request."""
+        return _sha256(
+            f"{model}|{temperature}|{system_instructions}|{content[:CACHE_CONTENT_CHARS]}"
+        )
+
+    @staticmethod
+    def schema_version(model: str, system_instructions: str) -> str:
+        """Return the namespace for a model/instructions pair."""
+        return _sha256(f"{model}|{system_instructions}")[:16]
+
+    def _entry_path(self, schema: str, key: str) -> Path:
+        return self.root / schema / key[:2] / f"{key}.json"
+
+    def get(self, model: str, temperature: float, system_instructions: str,
+            content: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result, or None on a miss or unreadable entry."""
+        path = self._entry_path(
+            self.schema_version(model, system_instructions),
+            self.make_key(model, temperature, system_instructions, content),
+        )
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                result = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+        try:
+            os.utime(path)  # keep recently used entries out of pruning
+        except OSError:
+            pass
+        return result
+
+    def put(self, model: str, temperature: float, system_instructions: str,
+            content: str, result: Dict[str, Any]) -> None:
+        """Store a result atomically; ERROR results are never cached."""
+        if result.get("modelDetermination", "ERROR") == "ERROR":
+            return
+        path = self._entry_path(
+            self.schema_version(model, system_instructions),
+            self.make_key(model, temperature, system_instructions, content),
+        )
+        tmp_name = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(result, f)
+            self._bound.commit(tmp_name, path)
+            tmp_name = None
+        except OSError as e:
+            logger.warning(f"Could not write cache entry {path}: {e}")
+        finally:
+            if tmp_name is not None:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
@@ -9,10 +9,19 @@ Run as script to see file stats for a directory:
 """
 
 import os
+import queue
+import re
 import sys
 import subprocess
+import collections
+import concurrent.futures
+import functools
+import hashlib
+import itertools
+import tempfile
+import threading
 from pathlib import Path
-from typing import Dict, Set, List, Iterator, Tuple, Union
+from typing import Deque, Dict, Set, List, Iterable, Iterator, Optional, Tuple, Union
 from dataclasses import dataclass
 import datetime
 import logging
@@ -54,6 +63,13 @@ except Exception:
     Image = None
     pytesseract = None
 
+# Import classifier_cache with absolute import
+try:
+    from RecordsClassifierGui.logic.classifier_cache import SizeBoundedDir, cache_dir_from_env
+except ImportError:
+    # Fallback for running this file as a script
+    from classifier_cache import SizeBoundedDir, cache_dir_from_env
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("file_scanner")
 
@@ -68,7 +84,7 @@ EXCLUDE_EXT: Set[str] = frozenset({
     '.psm1', '.db', '.mdb', '.accdb'
 })
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FileInfo:
     """Information about a discovered file."""
     path: Path
@@ -77,6 +93,102 @@ class FileInfo:
     extension: str
     category: str  # 'destroy', 'analyze', 'skip'
     reason: str
+    stat: Optional[os.stat_result] = None  # raw stat, reusable by callers
+
+def _name_suffix(name: str) -> str:
+    """Return the extension of a file name exactly as ``Path(name).suffix`` would."""
+    dot = name.rfind('.')
+    if 0 < dot < len(name) - 1:
+        return name[dot:]
+    return ''
+
+def _is_hidden_name(name: str) -> bool:
+    """True for hidden ('.') and Office lock ('~$') file or folder names."""
+    return name[:1] == '.' or name[:2] == '~$'
+
+def _list_directory(path: str, prime_stat: bool = True) -> Tuple[List[os.DirEntry], List[str]]:
+    """
+    List one directory as (file entries, subdirectory paths).
+
+    Hidden ('.') and Office lock ('~$') entries are skipped by name before
+    any type check, which also prunes whole hidden subtrees such as
+    ``.git`` or ``.venv``. Symlinked files are listed like regular files,
+    but symlinked directories are not returned for descent. A directory
+    that cannot be listed is logged and comes back empty. With
+    ``prime_stat`` each file entry's stat is taken on the calling thread.
+    """
+    files: List[os.DirEntry] = []
+    subdirs: List[str] = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if _is_hidden_name(entry.name):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file():
+                        if prime_stat:
+                            try:
+                                entry.stat()
+                            except OSError:
+                                pass  # reported when the entry is analyzed
+                        files.append(entry)
+                except OSError as e:
+                    logger.warning(f"Error reading entry {entry.path}: {e}")
+    except PermissionError as e:
+        logger.warning(f"Permission denied: {e}")
+    except OSError as e:
+        logger.warning(f"Error scanning directory {path}: {e}")
+    return files, subdirs
+
+# Directory listings _scandir_recursive may buffer ahead of its consumer
+_PREFETCH_DIRS = 2
+
+def _scandir_recursive(path: Union[str, Path]) -> Iterator[os.DirEntry]:
+    """
+    Yield a ``DirEntry`` for every file below ``path``, depth first.
+
+    A read-ahead thread lists the next directories while the caller works
+    through the current one, hiding directory-open latency on network
+    shares. Entries are filtered as in ``_list_directory``; stat is left to
+    the caller so name-only filters stay free of syscalls.
+    """
+    listings: queue.Queue = queue.Queue(maxsize=_PREFETCH_DIRS)
+    stop = threading.Event()
+
+    def put(item) -> None:
+        # Give up once the consumer has gone away, instead of blocking forever
+        while not stop.is_set():
+            try:
+                listings.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def walk() -> None:
+        pending = [str(path)]
+        try:
+            while pending and not stop.is_set():
+                files, subdirs = _list_directory(pending.pop(), prime_stat=False)
+                pending.extend(reversed(subdirs))
+                if files:
+                    put(files)
+            put(None)
+        except Exception as e:
+            put(e)
+
+    threading.Thread(target=walk, name="scandir-readahead", daemon=True).start()
+    try:
+        while True:
+            item = listings.get()
+            if item is None:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield from item
+    finally:
+        stop.set()
 
 class FileScanner:
     """
@@ -86,55 +198,107 @@ class FileScanner:
         self.include_ext = include_ext or INCLUDE_EXT
         self.exclude_ext = exclude_ext or EXCLUDE_EXT
         self.destroy_threshold = datetime.datetime.now() - datetime.timedelta(days=6 * 365)
+        # Same cutoff as a POSIX timestamp, compared directly with st_mtime
+        self.destroy_threshold_ts: float = self.destroy_threshold.timestamp()
 
-    def scan_directory(self, directory_path: Union[str, Path]) -> Iterator[FileInfo]:
-        """
-        Scan a directory and yield FileInfo objects for all discovered files.
-        """
+    @staticmethod
+    def _check_directory(directory_path: Union[str, Path]) -> Path:
+        """Return ``directory_path`` as a Path, raising ValueError unless it is a directory."""
         directory = Path(directory_path)
         if not directory.exists():
             raise ValueError(f"Directory does not exist: {directory}")
         if not directory.is_dir():
             raise ValueError(f"Path is not a directory: {directory}")
+        return directory
+
+    def scan_directory(
+        self, directory_path: Union[str, Path], categories: Optional[Set[str]] = None
+    ) -> Iterator[FileInfo]:
+        """
+        Scan a directory and yield FileInfo objects for all discovered files.
+
+        If ``categories`` is given, only files in those categories are yielded.
+        """
+        directory = self._check_directory(directory_path)
         logger.info(f"Scanning directory: {directory}")
 
-        for file_path in directory.rglob('*'):
-            if not file_path.is_file():
-                continue
-            if file_path.name.startswith('.') or file_path.name.startswith('~$'):
-                continue
-            try:
-                file_info = self._analyze_file(file_path)
+        wanted = frozenset(categories) if categories is not None else None
+        # A file whose extension rules it out can only be 'destroy' or 'skip';
+        # when neither is wanted it is dropped before its stat is taken
+        prefilter = wanted is not None and not (wanted & {'destroy', 'skip'})
+        for entry in _scandir_recursive(directory):
+            if prefilter:
+                extension = _name_suffix(entry.name).lower()
+                if extension in self.exclude_ext or extension not in self.include_ext:
+                    continue
+            file_info = self._file_info(entry)
+            if wanted is None or file_info.category in wanted:
                 yield file_info
-            except Exception as e:
-                logger.warning(f"Error analyzing file {file_path}: {e}")
-                yield FileInfo(
-                    path=file_path,
-                    size_bytes=0,
-                    modified_time=datetime.datetime.now(),
-                    extension=file_path.suffix.lower(),
-                    category='skip',
-                    reason=f"Error analyzing file: {e}"
+
+    def scan_directory_parallel(
+        self, directory_path: Union[str, Path], workers: int = 8
+    ) -> Iterator[FileInfo]:
+        """
+        Like ``scan_directory``, but list directories on a thread pool.
+
+        Each task lists one directory and stats its files; the subdirectories
+        it finds are submitted as new tasks. ``os.scandir`` and ``stat``
+        release the GIL, so on high-latency shares (SMB/NFS) many directory
+        reads are in flight at once. Files are yielded as their directory
+        finishes, so the order differs from ``scan_directory``.
+        """
+        directory = self._check_directory(directory_path)
+        logger.info(f"Scanning directory in parallel: {directory}")
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, workers), thread_name_prefix="scan"
+        ) as pool:
+            pending = {pool.submit(_list_directory, str(directory))}
+            while pending:
+                done, pending = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
                 )
+                for future in done:
+                    files, subdirs = future.result()
+                    pending.update(pool.submit(_list_directory, sub) for sub in subdirs)
+                    for entry in files:
+                        yield self._file_info(entry)
+
+    def _file_info(self, entry: os.DirEntry) -> FileInfo:
+        """Analyze one entry, turning errors into a 'skip' FileInfo."""
+        try:
+            return self._analyze_file(entry)
+        except Exception as e:
+            logger.warning(f"Error analyzing file {entry.path}: {e}")
+            return FileInfo(
+                path=Path(entry.path),
+                size_bytes=0,
+                modified_time=datetime.datetime.now(),
+                extension=_name_suffix(entry.name).lower(),
+                category='skip',
+                reason=f"Error analyzing file: {e}"
+            )
 
-    def _analyze_file(self, file_path: Path) -> FileInfo:
+    def _analyze_file(self, entry: os.DirEntry) -> FileInfo:
         """Analyze a single file and determine its category."""
-        stat_info = file_path.stat()
-        modified_time = datetime.datetime.fromtimestamp(stat_info.st_mtime)
-        extension = file_path.suffix.lower()
-        category, reason = self._categorize_file(modified_time, extension)
+        # DirEntry.stat() reuses what the directory listing already returned
+        # where the platform provides it (Windows) and caches it elsewhere
+        stat_info = entry.stat()
+        extension = _name_suffix(entry.name).lower()
+        category, reason = self._categorize_file(stat_info.st_mtime, extension)
         return FileInfo(
-            path=file_path,
+            path=Path(entry.path),
             size_bytes=stat_info.st_size,
-            modified_time=modified_time,
+            modified_time=datetime.datetime.fromtimestamp(stat_info.st_mtime),
             extension=extension,
             category=category,
-            reason=reason
+            reason=reason,
+            stat=stat_info,
         )
 
-    def _categorize_file(self, modified_time: datetime.datetime, extension: str) -> Tuple[str, str]:
-        """Categorize a file based on age and type."""
-        if modified_time < self.destroy_threshold:
+    def _categorize_file(self, mtime: float, extension: str) -> Tuple[str, str]:
+        """Categorize a file based on age (``st_mtime``) and type."""
+        if mtime < self.destroy_threshold_ts:
             return 'destroy', 'Older than 6 years - automatic destroy'
         if extension in self.exclude_ext:
             return 'skip', f'Excluded file type: {extension}'
@@ -143,18 +307,149 @@ class FileScanner:
         return 'analyze', 'Supported file type within retention period'
 
     def get_file_counts(self, directory_path: Union[str, Path]) -> Dict[str, int]:
-        """Get counts of files by category without yielding individual files."""
+        """
+        Get counts of files by category without yielding individual files.
+
+        Categorizes straight from the directory entries, so no FileInfo,
+        Path or datetime is built per file; the counts match what
+        ``scan_directory`` would report.
+        """
+        directory = self._check_directory(directory_path)
+
         counts = {'destroy': 0, 'analyze': 0, 'skip': 0, 'total': 0}
-        for file_info in self.scan_directory(directory_path):
-            counts[file_info.category] += 1
+        threshold_ts = self.destroy_threshold_ts
+        exclude_ext = self.exclude_ext
+        include_ext = self.include_ext
+        for entry in _scandir_recursive(directory):
             counts['total'] += 1
+            try:
+                mtime = entry.stat().st_mtime
+            except OSError:
+                counts['skip'] += 1
+                continue
+            extension = _name_suffix(entry.name).lower()
+            if mtime < threshold_ts:
+                counts['destroy'] += 1
+            elif extension in exclude_ext or extension not in include_ext:
+                counts['skip'] += 1
+            else:
+                counts['analyze'] += 1
         return counts
 
+# Rough text per PDF page, used to bound how many pages are decoded. Text
+# layers are cheap, so they get a few times the OCR page budget to get past
+# cover and signature pages.
+_PDF_CHARS_PER_PAGE = 1500
+_PDF_TEXT_PAGE_FACTOR = 4
+
+# antiword gets this long per .doc, and its output is read only up to a few
+# bytes per wanted character, so a pathological file can't hang the scan.
+_ANTIWORD_TIMEOUT_SECONDS = 10
+_ANTIWORD_BYTES_PER_CHAR = 4
+
+# Rows read per worksheet; classification only needs a sample of each sheet.
+_XLSX_MAX_ROWS = 2000
+
+# Parsing/OCR results for these formats are memoized per file version, so
+# re-running a classification after a rule tweak skips the slow extractors.
+# Memory only by default; the disk layer is opt-in, like the LLM cache.
+_EXTRACT_CACHED_SUFFIXES = frozenset({'.pdf', '.docx', '.doc', '.pptx', '.xlsx'})
+
+class _UncachedResult(Exception):
+    """Carries a placeholder result out of the memoized path uncached."""
+
+    def __init__(self, text: str):
+        super().__init__(text)
+        self.text = text
+
+_extract_bounds: Dict[Path, SizeBoundedDir] = {}
+
+def _extract_cache_dir() -> Optional[Path]:
+    """
+    Return the on-disk extraction cache, PCRC_CACHE_DIR/extract, or None
+    when PCRC_CACHE_DIR is unset or PCRC_EXTRACT_CACHE=0.
+    """
+    if os.environ.get("PCRC_EXTRACT_CACHE", "1") == "0":
+        return None
+    return cache_dir_from_env("extract")
+
+@functools.lru_cache(maxsize=4096)
+def _extract_cached(path_str: str, mtime_ns: int, size: int, max_chars: int) -> str:
+    """
+    Extract one file version through the disk cache.
+
+    Placeholders such as "[Error reading DOCX: ...]" or "[openpyxl not
+    installed]" are raised as ``_UncachedResult`` so neither layer keeps them.
+    """
+    cache_dir = _extract_cache_dir()
+    entry = None
+    if cache_dir is not None:
+        key = hashlib.blake2b(
+            f"{path_str}|{mtime_ns}|{size}|{max_chars}".encode("utf-8", "surrogatepass")
+        ).hexdigest()
+        entry = cache_dir / key[:2] / key[2:]
+        try:
+            with open(entry, "r", encoding="utf-8", errors="surrogatepass", newline="") as fp:
+                text = fp.read()
+            try:
+                os.utime(entry)  # keep recently used entries out of pruning
+            except OSError:
+                pass
+            return text
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable extraction cache entry {entry}: {e}")
+
+    text = _extract_file_content(Path(path_str), max_chars)
+    if text.startswith("[") and text.endswith("]"):
+        raise _UncachedResult(text)
+    if entry is not None:
+        tmp_name = None
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=entry.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8", errors="surrogatepass", newline="") as fp:
+                fp.write(text)
+            bound = _extract_bounds.get(cache_dir)
+            if bound is None:
+                bound = _extract_bounds.setdefault(cache_dir, SizeBoundedDir(cache_dir))
+            bound.commit(tmp_name, entry)
+            tmp_name = None
+        except OSError as e:
+            logger.warning(f"Could not write extraction cache entry {entry}: {e}")
+        finally:
+            if tmp_name is not None:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+    return text
+
 def extract_file_content(f: Path, max_chars: int = 4000) -> str:
     """
     Extract text content from a file, using OCR/parsers for binary formats.
     Returns up to max_chars of cleaned text.
+
+    PDF and Office results are cached by (absolute path, mtime, size,
+    max_chars) in memory, and also under PCRC_CACHE_DIR/extract when that
+    variable is set (bounded by PCRC_CACHE_MAX_MB).
     """
+    f = Path(f)
+    if f.suffix.lower() in _EXTRACT_CACHED_SUFFIXES:
+        try:
+            st = f.stat()
+        except OSError:
+            st = None
+        if st is not None:
+            try:
+                return _extract_cached(os.path.abspath(f), st.st_mtime_ns, st.st_size, max_chars)
+            except _UncachedResult as r:
+                return r.text
+    return _extract_file_content(f, max_chars)
+
+def _extract_file_content(f: Path, max_chars: int) -> str:
+    """Uncached body of ``extract_file_content``."""
     suffix = f.suffix.lower()
     try:
         if suffix == '.txt':
@@ -170,10 +465,12 @@ def extract_file_content(f: Path, max_chars: int = 4000) -> str:
             return f"[Unreadable file: {suffix}]"
         elif suffix == '.pdf':
             text = ""
+            ocr_pages = max(1, -(-max_chars // _PDF_CHARS_PER_PAGE))
+            text_pages = ocr_pages * _PDF_TEXT_PAGE_FACTOR
             if pdfplumber:
                 try:
                     with pdfplumber.open(str(f)) as pdf:
-                        for page in pdf.pages:
+                        for page in pdf.pages[:text_pages]:
                             text += page.extract_text() or ""
                             if len(text) >= max_chars:
                                 break
@@ -183,7 +480,7 @@ def extract_file_content(f: Path, max_chars: int = 4000) -> str:
                 try:
                     with open(f, 'rb') as fp:
                         reader = PyPDF2.PdfReader(fp)
-                        for page in reader.pages:
+                        for page in itertools.islice(reader.pages, text_pages):
                             text += page.extract_text() or ""
                             if len(text) >= max_chars:
                                 break
@@ -192,7 +489,9 @@ def extract_file_content(f: Path, max_chars: int = 4000) -> str:
             if not text and pytesseract and Image:
                 try:
                     import pdf2image
-                    images = pdf2image.convert_from_path(str(f))
+                    images = pdf2image.convert_from_path(
+                        str(f), first_page=1, last_page=ocr_pages
+                    )
                     for img in images:
                         text += pytesseract.image_to_string(img)
                         if len(text) >= max_chars:
@@ -211,28 +510,21 @@ def extract_file_content(f: Path, max_chars: int = 4000) -> str:
             else:
                 return "[python-docx not installed]"
         elif suffix == '.doc':
-            try:
-                result = subprocess.run(
-                    ["antiword", str(f)], stdout=subprocess.PIPE, check=True
-                )
-                text = result.stdout.decode("utf-8", errors="ignore")
-                return _clean_text(text)[:max_chars]
-            except FileNotFoundError:
-                return "[antiword not installed for .doc]"
-            except subprocess.CalledProcessError as exc:
-                return f"[Error reading DOC: {exc}]"
+            return _antiword_text(f, max_chars)
         elif suffix == '.pptx':
             if Presentation:
                 try:
                     prs = Presentation(str(f))
                     text: List[str] = []
+                    total_len = 0
                     for slide in prs.slides:
                         for shape in slide.shapes:
                             if hasattr(shape, "text"):
                                 text.append(shape.text)
-                                if sum(len(t) for t in text) >= max_chars:
+                                total_len += len(shape.text)
+                                if total_len >= max_chars:
                                     break
-                        if sum(len(t) for t in text) >= max_chars:
+                        if total_len >= max_chars:
                             break
                     return _clean_text("\n".join(text))[:max_chars]
                 except Exception as exc:
@@ -243,18 +535,28 @@ def extract_file_content(f: Path, max_chars: int = 4000) -> str:
             if openpyxl:
                 try:
                     wb = openpyxl.load_workbook(str(f), read_only=True, data_only=True)
-                    text: List[str] = []
-                    for ws in wb.worksheets:
-                        for row in ws.iter_rows(values_only=True):
-                            for cell in row:
-                                if cell is not None:
-                                    text.append(str(cell))
-                                    if sum(len(t) for t in text) >= max_chars:
-                                        break
-                            if sum(len(t) for t in text) >= max_chars:
+                    try:
+                        text: List[str] = []
+                        total_len = 0
+                        for ws in wb.worksheets:
+                            # Ignore the stored dimension; bad ones make openpyxl
+                            # pad every row out to a huge bounding box.
+                            ws.reset_dimensions()
+                            rows = itertools.islice(ws.iter_rows(values_only=True), _XLSX_MAX_ROWS)
+                            for row in rows:
+                                for cell in row:
+                                    if cell is not None:
+                                        s = str(cell)
+                                        text.append(s)
+                                        total_len += len(s)
+                                        if total_len >= max_chars:
+                                            break
+                                if total_len >= max_chars:
+                                    break
+                            if total_len >= max_chars:
                                 break
-                        if sum(len(t) for t in text) >= max_chars:
-                            break
+                    finally:
+                        wb.close()
                     return _clean_text(" ".join(text))[:max_chars]
                 except Exception as e:
                     return f"[Error reading XLSX: {str(e)}]"
@@ -265,12 +567,75 @@ def extract_file_content(f: Path, max_chars: int = 4000) -> str:
     except Exception as e:
         return f"[Error extracting content: {str(e)}]"
 
+def batch_extract(
+    paths: Iterable[Path], max_chars: int = 4000, workers: Optional[int] = None
+) -> Iterator[Tuple[Path, str]]:
+    """
+    Yield ``(path, extract_file_content(path))`` in input order.
+
+    With ``workers`` > 1 the CPU-bound parsing/OCR is spread across a
+    process pool. The pool is opt-in: ``None`` (the default) and ``1``
+    extract in-process, because spawned workers relaunch a frozen
+    (PyInstaller) executable unless its entry point calls
+    ``multiprocessing.freeze_support()``. ``paths`` is consumed lazily with
+    at most ``workers * 2`` files in flight, so a scan generator can feed
+    it while the walk is still running.
+    """
+    extract = functools.partial(extract_file_content, max_chars=max_chars)
+    if not workers or workers <= 1:
+        for path in paths:
+            path = Path(path)
+            yield path, extract(path)
+        return
+    window: Deque[Tuple[Path, concurrent.futures.Future]] = collections.deque()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        try:
+            for path in paths:
+                path = Path(path)
+                window.append((path, pool.submit(extract, path)))
+                if len(window) >= workers * 2:
+                    done, future = window.popleft()
+                    yield done, future.result()
+            while window:
+                done, future = window.popleft()
+                yield done, future.result()
+        finally:
+            # Abandoned early: don't start files nobody will read
+            for _path, future in window:
+                future.cancel()
+
+def _antiword_text(f: Path, max_chars: int) -> str:
+    """Run antiword on a .doc with a time limit and a cap on output read."""
+    args = ["antiword", str(f)]
+    try:
+        proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    except FileNotFoundError:
+        return "[antiword not installed for .doc]"
+    limit = max_chars * _ANTIWORD_BYTES_PER_CHAR
+    timer = threading.Timer(_ANTIWORD_TIMEOUT_SECONDS, proc.kill)
+    timer.start()
+    try:
+        raw = proc.stdout.read(limit)
+        truncated = len(raw) >= limit
+        if truncated:
+            proc.kill()  # the rest of the document isn't needed
+        returncode = proc.wait()
+        timed_out = timer.finished.is_set()
+    finally:
+        timer.cancel()
+        proc.stdout.close()
+    if timed_out:
+        return f"[antiword timed out after {_ANTIWORD_TIMEOUT_SECONDS}s on .doc]"
+    if returncode != 0 and not truncated:
+        return f"[Error reading DOC: {subprocess.CalledProcessError(returncode, args)}]"
+    return _clean_text(raw.decode("utf-8", errors="ignore"))[:max_chars]
+
+_WS_NEWLINE = re.compile(r'[\r\n]+')
+_WS_SPACE = re.compile(r'[ \t]+')
+
 def _clean_text(text: str) -> str:
     """Collapse whitespace, strip control chars, etc."""
-    import re
-    text = re.sub(r'[\r\n]+', '\n', text)
-    text = re.sub(r'[ \t]+', ' ', text)
-    return text.strip()
+    return _WS_SPACE.sub(' ', _WS_NEWLINE.sub('\n', text)).strip()
 
 def main():
     """Test/CLI entry point for the file scanner."""
@@ -282,9 +647,8 @@ def main():
     counts = scanner.get_file_counts(args.directory)
     print("File counts:", counts)
     print("Sample 'analyze' files:")
-    for fi in scanner.scan_directory(args.directory):
-        if fi.category == "analyze":
-            print(f"- {fi.path} ({fi.size_bytes} bytes) | {fi.reason}")
+    for fi in scanner.scan_directory(args.directory, categories={"analyze"}):
+        print(f"- {fi.path} ({fi.size_bytes} bytes) | {fi.reason}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,311 @@
+import asyncio
+import json
+import sys
+import types
+
+import pytest
+
+from RecordsClassifierGui.logic.classification_engine import LLMEngine, _extract_json_span
+
+
+@pytest.fixture
+def fake_ollama(monkeypatch):
+    """Install a fake ``ollama`` whose AsyncClient streams canned replies.
+
+    Append each reply to ``server.replies`` as a list of streamed pieces, or
+    as an exception for ``chat`` to raise.
+    """
+    server = types.SimpleNamespace(
+        replies=[], prompts=[], pieces_sent=0, list_error=None, list_calls=0,
+        list_delay=0.0, clients=[], engines=[],
+    )
+
+    class AsyncClient:
+        def __init__(self, **kwargs):
+            self.closed = False
+            server.clients.append(self)
+
+        async def list(self):
+            server.list_calls += 1
+            if server.list_delay:
+                await asyncio.sleep(server.list_delay)
+            if server.list_error is not None:
+                raise server.list_error
+            return {"models": []}
+
+        async def chat(self, model, messages, options, stream=False):
+            server.prompts.append(messages[-1]["content"])
+            pieces = server.replies.pop(0)
+            if isinstance(pieces, Exception):
+                raise pieces
+
+            async def chunks():
+                for piece in pieces:
+                    server.pieces_sent += 1
+                    yield {"message": {"content": piece}}
+
+            return chunks()
+
+        async def close(self):
+            self.closed = True
+
+    def make_engine(**kwargs):
+        engine = LLMEngine(timeout_seconds=5, **kwargs)
+        server.engines.append(engine)
+        return engine
+
+    server.make_engine = make_engine
+    monkeypatch.setitem(sys.modules, "ollama", types.SimpleNamespace(AsyncClient=AsyncClient))
+    monkeypatch.setattr(LLMEngine, "_global_available", None)
+    yield server
+    for engine in server.engines:
+        engine.close()
+
+
+def _reply(determination="KEEP", confidence=80):
+    return json.dumps({
+        "modelDetermination": determination,
+        "confidenceScore": confidence,
+        "contextualInsights": "because",
+    })
+
+
+def test_extract_json_span_handles_nesting_and_strings():
+    raw = 'Result: {"a": {"b": "}{\\"x"}, "c": 1} trailing {"d": 2}'
+    assert _extract_json_span(raw, "{", "}") == '{"a": {"b": "}{\\"x"}, "c": 1}'
+    assert _extract_json_span('[{"a": "]"}, [1, 2]] end', "[", "]") == '[{"a": "]"}, [1, 2]]'
+    assert _extract_json_span('{"a": 1', "{", "}") is None
+    assert _extract_json_span("no json here", "{", "}") is None
+
+
+def test_read_file_content_matches_text_mode(tmp_path):
+    from RecordsClassifierGui.logic.classification_engine import get_default_engine
+
+    path = tmp_path / "notes.txt"
+    path.write_bytes(b"one\r\ntwo\rthree\n\xc3\xa9four\nfive")
+    for max_lines in (1, 3, 10):
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            expected = "".join([next(f, "") for _ in range(max_lines)])
+        assert get_default_engine()._read_file_content(path, max_lines) == expected
+
+
+def test_preclassify_rules_and_override(tmp_path):
+    from RecordsClassifierGui.logic import classification_engine as ce
+
+    assert ce._preclassify("DRAFT budget memo") == ("TRANSITORY", 85, "Draft/temp marker")
+    assert ce._preclassify("Signed lease agreement") == ("KEEP", 75, "Policy/contract")
+    assert ce._preclassify("Quarterly totals") is None
+    assert ce._preclassify("DRAFT agenda") == ("TRANSITORY", 85, "Draft/temp marker")
+
+    rules_file = tmp_path / "rules.yaml"
+    rules_file.write_text(
+        "- pattern: '(?i)invoice'\n"
+        "  determination: KEEP\n"
+        "  confidence: 90\n"
+        "  reason: Invoice\n"
+    )
+    rules = ce._load_preclassify_rules(str(rules_file))
+    assert [(rx.pattern, det, conf, why) for rx, det, conf, why in rules] == [
+        ("(?i)invoice", "KEEP", 90, "Invoice")
+    ]
+
+
+def test_metadata_cache_is_opt_in_and_invalidated(tmp_path):
+    import os
+
+    from RecordsClassifierGui.logic.classification_engine import ClassificationEngine
+    from RecordsClassifierGui.logic.classifier_cache import ResponseCache
+
+    path = tmp_path / "memo.txt"
+    path.write_text("draft memo")
+    cached = ClassificationEngine(cache=ResponseCache(tmp_path / "c"), metadata_cache_size=8)
+    uncached = ClassificationEngine(cache=ResponseCache(tmp_path / "c"))
+    assert cached.classify_file(path).model_determination == "TRANSITORY"
+    os.utime(path, (0, 0))
+    assert cached.classify_file(path).model_determination == "TRANSITORY"
+    assert uncached.classify_file(path).model_determination == "DESTROY"
+    cached.invalidate(path)
+    assert cached.classify_file(path).model_determination == "DESTROY"
+
+
+def test_batch_does_not_cache_truncated_items(fake_ollama, tmp_path):
+    from RecordsClassifierGui.logic.classifier_cache import ResponseCache
+
+    cache = ResponseCache(tmp_path)
+    engine = fake_ollama.make_engine(cache=cache)
+    long_text, short_text = "x" * 3000, "short memo"
+    fake_ollama.replies.append([f"[{_reply('KEEP')}, {_reply('TRANSITORY')}]"])
+
+    results = engine.classify_batch_with_llm("m", "rules", [long_text, short_text])
+    assert [r["modelDetermination"] for r in results] == ["KEEP", "TRANSITORY"]
+    assert cache.get("m", 0.1, "rules", short_text)["modelDetermination"] == "TRANSITORY"
+    assert cache.get("m", 0.1, "rules", long_text) is None
+
+
+def test_call_timeout_scales_and_is_capped_by_timeout_seconds():
+    engine = LLMEngine(timeout_seconds=30)
+    assert engine._call_timeout(0) == pytest.approx(256 / 30 * 1.5)
+    assert engine._call_timeout(200_000) == 30
+    assert engine._call_timeout(0, output_tokens=1) == LLMEngine.MIN_CALL_TIMEOUT_SECONDS
+    assert LLMEngine(timeout_seconds=2)._call_timeout(0) == 2
+
+
+def _loop_threads():
+    import threading
+
+    return [t for t in threading.enumerate() if t.name == "ollama-loop"]
+
+
+def test_stream_stops_at_first_complete_json(fake_ollama):
+    engine = fake_ollama.make_engine()
+    reply = _reply("KEEP")
+    fake_ollama.replies.append(
+        ["Sure: " + reply[:20], reply[20:-1], '} and "{"', " extra {", "never sent"]
+    )
+    assert engine.classify_with_llm("m", "rules", "memo")["modelDetermination"] == "KEEP"
+    assert fake_ollama.pieces_sent == 3
+
+
+def test_json_in_prose_with_braces_inside_strings(fake_ollama):
+    engine = fake_ollama.make_engine()
+    result = {
+        "modelDetermination": "TRANSITORY",
+        "confidenceScore": 60,
+        "contextualInsights": 'says "}{" and {nested}',
+    }
+    text = json.dumps(result)
+    fake_ollama.replies.append(["Answer -> ", text[:-5], text[-5:] + " {done}"])
+    assert engine.classify_with_llm("m", "rules", "memo") == result
+
+
+def test_batch_count_mismatch_falls_back_to_single_calls(fake_ollama):
+    engine = fake_ollama.make_engine()
+    fake_ollama.replies.extend([[f"[{_reply('KEEP')}]"], [_reply("KEEP")], [_reply("DESTROY")]])
+    results = engine.classify_batch_with_llm("m", "rules", ["first", "second"])
+    assert [r["modelDetermination"] for r in results] == ["KEEP", "DESTROY"]
+    assert len(fake_ollama.prompts) == 3
+    assert not fake_ollama.replies
+
+
+def test_batch_sends_only_cache_misses(fake_ollama, tmp_path):
+    from RecordsClassifierGui.logic.classifier_cache import ResponseCache
+
+    cache = ResponseCache(tmp_path)
+    cached = json.loads(_reply("KEEP", 99))
+    cache.put("m", 0.1, "rules", "known", cached)
+    engine = fake_ollama.make_engine(cache=cache)
+    fake_ollama.replies.append([f"[{_reply('TRANSITORY')}, {_reply('DESTROY')}]"])
+
+    results = engine.classify_batch_with_llm("m", "rules", ["new one", "known", "new two"])
+    assert [r["modelDetermination"] for r in results] == ["TRANSITORY", "KEEP", "DESTROY"]
+    assert results[1] == cached
+    (prompt,) = fake_ollama.prompts
+    assert "new one" in prompt and "new two" in prompt and "known" not in prompt
+
+
+def test_degraded_mode_skips_calls_then_recovers(fake_ollama):
+    import time
+
+    engine = fake_ollama.make_engine()
+    fake_ollama.replies.extend([ConnectionError("down")] * LLMEngine.DEGRADE_AFTER_FAILURES)
+    for _ in range(LLMEngine.DEGRADE_AFTER_FAILURES):
+        assert engine.classify_with_llm("m", "rules", "memo")["modelDetermination"] == "ERROR"
+
+    probes = fake_ollama.list_calls
+    skipped = engine.classify_with_llm("m", "rules", "memo")
+    assert skipped["contextualInsights"] == "LLM degraded"
+    assert fake_ollama.list_calls == probes
+
+    engine._probe_interval = 0.0
+    engine._degraded_until = time.monotonic()
+    for _ in range(LLMEngine.RECOVER_AFTER_PROBES - 1):
+        assert engine.classify_with_llm("m", "rules", "memo")["contextualInsights"] == "LLM degraded"
+    fake_ollama.replies.append([_reply("KEEP")])
+    assert engine.classify_with_llm("m", "rules", "memo")["modelDetermination"] == "KEEP"
+    assert fake_ollama.list_calls == probes + LLMEngine.RECOVER_AFTER_PROBES
+
+
+def test_probe_is_lazy_and_skipped_for_cache_hits(fake_ollama, tmp_path):
+    from RecordsClassifierGui.logic.classifier_cache import ResponseCache
+
+    cache = ResponseCache(tmp_path)
+    cache.put("m", 0.1, "rules", "known", json.loads(_reply("KEEP")))
+    engine = fake_ollama.make_engine(cache=cache)
+    assert engine.classify_with_llm("m", "rules", "known")["modelDetermination"] == "KEEP"
+    assert not fake_ollama.clients and not _loop_threads()
+
+    fake_ollama.replies.extend([[_reply("KEEP")], [_reply("DESTROY")]])
+    engine.classify_with_llm("m", "rules", "first")
+    engine.classify_with_llm("m", "rules", "second")
+    assert len(fake_ollama.clients) == 1
+    assert fake_ollama.list_calls == 1
+
+
+def test_failed_probe_releases_client_and_loop(fake_ollama):
+    fake_ollama.list_error = ConnectionError("refused")
+    engine = fake_ollama.make_engine()
+    result = engine.classify_with_llm("m", "rules", "memo")
+    assert result["contextualInsights"] == "LLM service unavailable"
+    (client,) = fake_ollama.clients
+    assert client.closed
+    assert engine._loop is None and not _loop_threads()
+
+
+def test_close_stops_loop_and_closes_client(fake_ollama):
+    engine = fake_ollama.make_engine()
+    fake_ollama.replies.append([_reply("KEEP")])
+    engine.classify_with_llm("m", "rules", "memo")
+    loop = engine._loop
+    assert _loop_threads()
+
+    engine.close()
+    assert fake_ollama.clients[0].closed
+    assert loop.is_closed() and not _loop_threads()
+    assert engine.classify_with_llm("m", "rules", "other")["modelDetermination"] == "ERROR"
+
+
+def test_classify_files_reports_symlink_loop_per_file(tmp_path):
+    import os
+
+    from RecordsClassifierGui.logic.classification_engine import ClassificationEngine
+
+    os.symlink(tmp_path / "b", tmp_path / "a")
+    os.symlink(tmp_path / "a", tmp_path / "b")
+    good = tmp_path / "memo.txt"
+    good.write_text("draft memo")
+
+    results = ClassificationEngine().classify_files([tmp_path / "a", good], batch_size=4)
+    assert [r.model_determination for r in results] == ["ERROR", "TRANSITORY"]
+
+
+def test_degraded_probe_runs_without_blocking_other_callers(fake_ollama):
+    import threading
+    import time
+
+    engine = fake_ollama.make_engine()
+    engine._ensure_probed()
+    engine._probe_interval = 60.0
+    engine._degraded_until = time.monotonic() - 1
+    fake_ollama.list_delay = 0.5
+    probe = threading.Thread(target=engine._llm_ready)
+    probe.start()
+    while not engine._probing:
+        time.sleep(0.01)
+
+    started = time.monotonic()
+    assert engine._llm_ready() is False
+    assert time.monotonic() - started < 0.2
+    probe.join()
+    assert not engine._probing and engine._healthy_probes == 1
+
+
+def test_conflicting_preclassify_cues_go_to_the_llm(tmp_path):
+    from RecordsClassifierGui.logic import classification_engine as ce
+
+    text = "SERVICE AGREEMENT\nThis contract supersedes the previous draft."
+    assert ce._preclassify(text) is None
+
+    path = tmp_path / "agreement.txt"
+    path.write_text(text)
+    result = ce.ClassificationEngine().classify_file(path)
+    assert not result.contextual_insights.startswith("Pre-rule:")
@@ -2,6 +2,8 @@ import os
 import datetime
 import tempfile
 from pathlib import Path
+
+import pytest
 from RecordsClassifierGui.logic.classification_engine_fixed import (
     ClassificationEngine,
     classify_directory,
@@ -144,3 +146,185 @@ def test_classify_directory_recurses(tmp_path):
     (sub / "nested.txt").write_text("hello")
     results = list(classify_directory(tmp_path, engine=engine))
     assert any(r.file_name == "nested.txt" for r in results)
+
+
+def test_keyword_counts_match_str_count():
+    engine = ClassificationEngine(timeout_seconds=1).llm_engine
+    text = "evidencevidence and the invoice, invoice ledger, budget memo"
+    counts = engine._count_keywords(text)
+    engine._keyword_automaton = None
+    assert engine._count_keywords(text) == counts
+    assert counts["invoice"] == 2
+    assert counts["evidence"] == 1
+
+
+def test_keywords_pick_best_label():
+    engine = ClassificationEngine(timeout_seconds=1).llm_engine
+    result = engine.classify_with_llm("", "", "Invoice for the budget ledger")
+    assert result["modelDetermination"] == "FINANCIAL"
+    assert "'invoice'" in result["contextualInsights"]
+
+
+def test_classify_directory_parallel_matches_serial(tmp_path, monkeypatch):
+    import RecordsClassifierGui.logic.classification_engine_fixed as cef
+
+    monkeypatch.setattr(cef, "PARALLEL_MIN_FILES", 4)
+    engine = ClassificationEngine(timeout_seconds=1)
+    for i in range(6):
+        (tmp_path / f"f{i}.txt").write_text("invoice" if i % 2 else "hello")
+
+    serial = list(classify_directory(tmp_path, engine=engine, max_workers=1))
+    parallel = list(classify_directory(tmp_path, engine=engine, max_workers=2))
+    assert [r.full_path for r in parallel] == [r.full_path for r in serial]
+    assert [r.model_determination for r in parallel] == [
+        r.model_determination for r in serial
+    ]
+
+
+def test_read_file_content_matches_text_mode(tmp_path):
+    engine = ClassificationEngine(timeout_seconds=1)
+    file_path = tmp_path / "mixed.txt"
+    file_path.write_bytes(b"one\r\ntwo\rthree\n\xc3\xa9\xff four\nfive\n")
+    with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
+        expected = "".join([next(f, "") for _ in range(4)])
+    assert engine._read_file_content(file_path, 4) == expected
+    assert engine._read_file_content(file_path, 4, size=0) == ""
+
+
+def test_read_file_content_bounds_cr_only_and_long_lines(tmp_path, monkeypatch):
+    from RecordsClassifierGui.logic import classification_engine_fixed as cef
+
+    engine = ClassificationEngine(timeout_seconds=1)
+    cr_only = tmp_path / "cr.txt"
+    cr_only.write_bytes(b"line\r" * 200_000)
+    assert engine._read_file_content(cr_only, 3) == "line\nline\nline\n"
+
+    split_crlf = tmp_path / "split.txt"
+    split_crlf.write_bytes(b"a\r\nb" + b"x" * 10 + b"\r\nc\r\n")
+    monkeypatch.setattr(cef, "_READ_CHUNK_BYTES", 2)
+    assert engine._read_file_content(split_crlf, 2) == "a\nb" + "x" * 10 + "\n"
+
+    monkeypatch.setattr(cef, "_READ_CHUNK_BYTES", 64)
+    monkeypatch.setattr(cef, "_MAX_READ_BYTES", 256)
+    one_line = tmp_path / "one_line.txt"
+    one_line.write_bytes(b"y" * 10_000)
+    assert engine._read_file_content(one_line, 5) == "y" * 256
+
+
+def test_missing_file_returns_error_result(tmp_path):
+    engine = ClassificationEngine(timeout_seconds=1)
+    missing = tmp_path / "gone.txt"
+    result = engine.classify_file(missing)
+    assert result.status == "error"
+    assert result.size_kb == 0
+    assert result.full_path == str(missing.resolve())
+
+
+def test_mixed_case_schedule_keywords_match(monkeypatch):
+    from RecordsClassifierGui.core import model_output_validation
+
+    keywords = dict(model_output_validation.SCHEDULE_6_KEYWORDS)
+    keywords["FINANCIAL"] = ["Voucher"] + keywords["FINANCIAL"]
+    monkeypatch.setattr(model_output_validation, "SCHEDULE_6_KEYWORDS", keywords)
+    engine = ClassificationEngine(timeout_seconds=1).llm_engine
+    result = engine.classify_with_llm("", "", "Travel VOUCHER attached")
+    assert result["modelDetermination"] == "FINANCIAL"
+    assert "'voucher'" in result["contextualInsights"]
+
+
+def test_classify_directory_missing_dir_raises(tmp_path):
+    with pytest.raises(ValueError):
+        list(classify_directory(tmp_path / "nope"))
+
+
+def test_extension_disposition_messages(tmp_path):
+    engine = ClassificationEngine(timeout_seconds=1)
+    log_file = tmp_path / "app.log"
+    log_file.write_text("invoice")
+    odd_file = tmp_path / "data.xyz"
+    odd_file.write_text("invoice")
+    assert engine.classify_file(log_file).contextual_insights == "Excluded file type: .log"
+    assert engine.classify_file(odd_file).contextual_insights == "Unsupported file type: .xyz"
+
+
+def test_parallel_default_engine_built_per_worker(tmp_path, monkeypatch):
+    import RecordsClassifierGui.logic.classification_engine_fixed as cef
+
+    monkeypatch.setattr(cef, "PARALLEL_MIN_FILES", 2)
+    for i in range(3):
+        (tmp_path / f"f{i}.txt").write_text("invoice")
+    results = list(classify_directory(tmp_path, max_workers=2))
+    assert [r.model_determination for r in results] == ["FINANCIAL"] * 3
+    assert cef.get_default_engine() is cef.get_default_engine()
+
+
+def test_tiny_content_is_transitory_without_scan(monkeypatch):
+    engine = ClassificationEngine(timeout_seconds=1).llm_engine
+
+    def fail(text):
+        raise AssertionError("keyword scan should be skipped")
+
+    monkeypatch.setattr(engine, "_count_keywords", fail)
+    for content in ("", "  \n", "ab"):
+        result = engine.classify_with_llm("", "", content)
+        assert result["modelDetermination"] == "TRANSITORY"
+        assert result["confidenceScore"] == 50
+
+
+def test_full_path_without_resolving_symlinks(tmp_path):
+    engine = ClassificationEngine(timeout_seconds=1)
+    target = tmp_path / "real.txt"
+    target.write_text("hello")
+    link = tmp_path / "link.txt"
+    try:
+        link.symlink_to(target)
+    except OSError:
+        pytest.skip("symlinks unavailable")
+    assert engine.classify_file(link).full_path == str(target.resolve())
+    result = engine.classify_file(link, resolve_symlinks=False)
+    assert result.full_path == os.path.abspath(link)
+
+
+def test_default_engine_built_once_under_concurrent_first_use(monkeypatch):
+    import threading
+
+    from RecordsClassifierGui.logic import classification_engine_fixed as cef
+
+    monkeypatch.setattr(cef, "_default_engine", None)
+    built = []
+    real_init = cef.ClassificationEngine.__init__
+
+    def slow_init(self, *args, **kwargs):
+        built.append(self)
+        threading.Event().wait(0.05)
+        real_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(cef.ClassificationEngine, "__init__", slow_init)
+    barrier = threading.Barrier(4)
+    engines = []
+
+    def first_use():
+        barrier.wait()
+        engines.append(cef.get_default_engine())
+
+    threads = [threading.Thread(target=first_use) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(built) == 1
+    assert all(engine is built[0] for engine in engines)
+
+
+def test_classify_directory_pool_is_opt_in(tmp_path, monkeypatch):
+    import RecordsClassifierGui.logic.classification_engine_fixed as cef
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("process pool started without max_workers")
+
+    monkeypatch.setattr(cef, "PARALLEL_MIN_FILES", 2)
+    monkeypatch.setattr(cef, "ProcessPoolExecutor", no_pool)
+    for i in range(3):
+        (tmp_path / f"f{i}.txt").write_text("invoice")
+    engine = ClassificationEngine(timeout_seconds=1)
+    assert len(list(classify_directory(tmp_path, engine=engine))) == 3
@@ -0,0 +1,78 @@
+import json
+
+from RecordsClassifierGui.logic.classifier_cache import ResponseCache
+
+
+def test_cache_round_trip_and_skips_errors(tmp_path):
+    cache = ResponseCache(tmp_path)
+    result = {"modelDetermination": "KEEP", "confidenceScore": 90, "contextualInsights": "ok"}
+    assert cache.get("m", 0.1, "rules", "contract text") is None
+    cache.put("m", 0.1, "rules", "contract text", result)
+    assert cache.get("m", 0.1, "rules", "contract text") == result
+    assert cache.get("m", 0.1, "other rules", "contract text") is None
+    assert cache.get("m", 0.2, "rules", "contract text") is None
+
+    cache.put("m", 0.1, "rules", "broken", {"modelDetermination": "ERROR"})
+    assert cache.get("m", 0.1, "rules", "broken") is None
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_disk_cache_is_opt_in(tmp_path, monkeypatch):
+    from RecordsClassifierGui.logic.classification_engine import LLMEngine
+
+    monkeypatch.delenv("PCRC_CACHE_DIR", raising=False)
+    assert ResponseCache.from_env() is None
+    assert LLMEngine().cache is None
+
+    monkeypatch.setenv("PCRC_CACHE_DIR", "")
+    assert ResponseCache.from_env() is None
+
+    monkeypatch.setenv("PCRC_CACHE_DIR", str(tmp_path))
+    assert ResponseCache.from_env().root == tmp_path / "llm"
+
+
+def test_cache_is_pruned_least_recently_used_first(tmp_path):
+    import os
+
+    from RecordsClassifierGui.logic import classifier_cache
+
+    result = {"modelDetermination": "KEEP", "confidenceScore": 90, "contextualInsights": "ok"}
+    cache = ResponseCache(tmp_path)
+    schema = cache.schema_version("m", "rules")
+
+    def entry(content):
+        return cache._entry_path(schema, cache.make_key("m", 0.1, "rules", content))
+
+    cache.put("m", 0.1, "rules", "old", result)
+    # Bound measured in disk blocks: room for two entries, not three
+    cache._bound.max_bytes = int(classifier_cache._disk_usage(os.stat(entry("old"))) * 2.5)
+    cache.put("m", 0.1, "rules", "used", result)
+    for n, content in enumerate(["old", "used"]):
+        os.utime(entry(content), (n, n))
+    assert cache.get("m", 0.1, "rules", "used") == result  # refreshes its mtime
+
+    cache.put("m", 0.1, "rules", "new", result)
+    assert cache.get("m", 0.1, "rules", "old") is None
+    assert cache.get("m", 0.1, "rules", "used") == result
+    assert cache.get("m", 0.1, "rules", "new") == result
+
+
+def test_cache_size_is_tracked_without_rescanning(tmp_path, monkeypatch):
+    from RecordsClassifierGui.logic import classifier_cache
+
+    walks = []
+    real_walk = classifier_cache.os.walk
+    monkeypatch.setattr(
+        classifier_cache.os, "walk", lambda root: walks.append(root) or real_walk(root)
+    )
+    result = {"modelDetermination": "KEEP", "confidenceScore": 90, "contextualInsights": "ok"}
+    cache = ResponseCache(tmp_path, max_bytes=10 * 1024 * 1024)
+    for n in range(20):
+        cache.put("m", 0.1, "rules", f"memo {n}", result)
+    cache.put("m", 0.1, "rules", "memo 0", result)  # overwrite is not double counted
+    assert len(walks) == 1
+
+    expected = sum(
+        classifier_cache._disk_usage(p.stat()) for p in tmp_path.rglob("*.json")
+    )
+    assert cache._bound._total == expected
@@ -0,0 +1,182 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from RecordsClassifierGui.logic.file_scanner import FileScanner, _name_suffix
+
+
+@pytest.mark.parametrize(
+    "name", ["a.txt", "archive.tar.gz", "report.", "noext", ".profile", "..", "Scan.PDF"]
+)
+def test_name_suffix_matches_path_suffix(name):
+    assert _name_suffix(name) == Path(name).suffix
+
+
+def test_scan_directory_finds_nested_files(tmp_path):
+    (tmp_path / "a.txt").write_text("x")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "b.exe").write_text("y")
+    (tmp_path / "~$lock.docx").write_text("z")
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "config.txt").write_text("hidden")
+
+    found = {
+        info.path.relative_to(tmp_path).as_posix(): info.category
+        for info in FileScanner().scan_directory(tmp_path)
+    }
+    assert found == {"a.txt": "analyze", "sub/b.exe": "skip"}
+
+
+def test_get_file_counts_matches_scan(tmp_path):
+    import os
+
+    for name in ["a.txt", "b.exe", "c.", "noext", "E.PDF", "sub/f.txt", "sub/g.zip"]:
+        path = tmp_path / name
+        path.parent.mkdir(exist_ok=True)
+        path.write_text("x")
+    os.utime(tmp_path / "noext", (0, 0))
+
+    scanner = FileScanner()
+    expected = {"destroy": 0, "analyze": 0, "skip": 0, "total": 0}
+    for info in scanner.scan_directory(tmp_path):
+        expected[info.category] += 1
+        expected["total"] += 1
+    assert scanner.get_file_counts(tmp_path) == expected
+    assert expected == {"destroy": 1, "analyze": 3, "skip": 3, "total": 7}
+
+
+def test_scan_directory_parallel_matches_serial(tmp_path):
+    for name in ["a.txt", "b.exe", "one/c.pdf", "one/two/d.md", ".hidden/e.txt"]:
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x")
+
+    scanner = FileScanner()
+    serial = sorted((info.path, info.category) for info in scanner.scan_directory(tmp_path))
+    parallel = sorted(
+        (info.path, info.category)
+        for info in scanner.scan_directory_parallel(tmp_path, workers=3)
+    )
+    assert parallel == serial
+    assert len(serial) == 4
+
+
+def test_extract_file_content_is_cached_per_file_version(tmp_path, monkeypatch):
+    from RecordsClassifierGui.logic import file_scanner
+
+    monkeypatch.setenv("PCRC_CACHE_DIR", str(tmp_path / "cache"))
+    calls = []
+
+    def fake_extract(f, max_chars):
+        calls.append(f)
+        return "[Error reading DOCX: locked]" if f.suffix == ".docx" else f"text of {f.name}"
+
+    monkeypatch.setattr(file_scanner, "_extract_file_content", fake_extract)
+    file_scanner._extract_cached.cache_clear()
+    try:
+        pdf = tmp_path / "a.pdf"
+        pdf.write_bytes(b"%PDF-1")
+        assert file_scanner.extract_file_content(pdf) == "text of a.pdf"
+        assert file_scanner.extract_file_content(pdf) == "text of a.pdf"
+        file_scanner._extract_cached.cache_clear()
+        assert file_scanner.extract_file_content(pdf) == "text of a.pdf"
+        assert len(calls) == 1
+
+        pdf.write_bytes(b"%PDF-1.7 changed")
+        file_scanner.extract_file_content(pdf)
+        assert len(calls) == 2
+
+        docx = tmp_path / "b.docx"
+        docx.write_bytes(b"PK")
+        file_scanner.extract_file_content(docx)
+        file_scanner.extract_file_content(docx)
+        assert len(calls) == 4
+    finally:
+        file_scanner._extract_cached.cache_clear()
+
+
+def test_batch_extract_preserves_input_order(tmp_path):
+    from RecordsClassifierGui.logic.file_scanner import batch_extract
+
+    paths = []
+    for i in range(12):
+        path = tmp_path / f"{i}.txt"
+        path.write_text(f"note   {i}")
+        paths.append(path)
+
+    expected = [(p, f"note {i}") for i, p in enumerate(paths)]
+    assert list(batch_extract(paths, max_chars=100)) == expected
+
+    consumed = []
+
+    def walk():
+        for path in paths:
+            consumed.append(path)
+            yield path
+
+    results = batch_extract(walk(), max_chars=100, workers=2)
+    first = next(results)
+    assert len(consumed) <= 2 * 2  # bounded window, not the whole walk
+    assert [first] + list(results) == expected
+
+
+
+def test_scan_directory_filters_by_category(tmp_path):
+    for name in ["a.txt", "b.exe", "c.unknown", "sub/d.pdf"]:
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x")
+    old = tmp_path / "old.exe"
+    old.write_text("x")
+    os.utime(old, (0, 0))
+
+    scanner = FileScanner()
+    everything = list(scanner.scan_directory(tmp_path))
+    for wanted in ({"analyze"}, {"analyze", "destroy"}, {"skip"}):
+        expected = sorted(info.path for info in everything if info.category in wanted)
+        found = sorted(info.path for info in scanner.scan_directory(tmp_path, categories=wanted))
+        assert found == expected
+
+
+def test_scandir_read_ahead_stops_when_abandoned(tmp_path):
+    import threading
+    import time
+
+    from RecordsClassifierGui.logic.file_scanner import _scandir_recursive
+
+    for i in range(20):
+        (tmp_path / f"d{i}").mkdir()
+        (tmp_path / f"d{i}" / "f.txt").write_text("x")
+
+    walk = _scandir_recursive(tmp_path)
+    next(walk)
+    walk.close()
+    deadline = time.monotonic() + 2
+    while any(t.name == "scandir-readahead" for t in threading.enumerate()):
+        assert time.monotonic() < deadline
+        time.sleep(0.02)
+
+
+def test_extract_disk_cache_is_opt_in(tmp_path, monkeypatch):
+    from RecordsClassifierGui.logic import file_scanner
+
+    monkeypatch.delenv("PCRC_CACHE_DIR", raising=False)
+    monkeypatch.setenv("HOME", str(tmp_path))
+    calls = []
+
+    def fake_extract(f, max_chars):
+        calls.append(f)
+        return "pdf text"
+
+    monkeypatch.setattr(file_scanner, "_extract_file_content", fake_extract)
+    file_scanner._extract_cached.cache_clear()
+    try:
+        pdf = tmp_path / "a.pdf"
+        pdf.write_bytes(b"%PDF-1")
+        assert file_scanner.extract_file_content(pdf) == "pdf text"
+        assert file_scanner.extract_file_content(pdf) == "pdf text"
+        assert len(calls) == 1
+        assert [p.name for p in tmp_path.rglob("*")] == ["a.pdf"]
+    finally:
+        file_scanner._extract_cached.cache_clear()
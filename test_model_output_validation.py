@@ -0,0 +1,125 @@
+import pytest
+
+from RecordsClassifierGui.core import model_output_validation as mov
+
+
+def _make_output(text="Approved final policy", label="OFFICIAL", model_conf=0.9):
+    keywords = mov.find_keywords(text, label)
+    hybrid = mov.hybrid_confidence(model_conf, text, label)
+    return {
+        "label": label,
+        "score": model_conf,
+        "text": text,
+        "timestamp": "2024-01-01T00:00:00Z",
+        "source_file": "doc.txt",
+        "classification_details": {
+            "schedule": "Schedule 6",
+            "keywords_found": keywords,
+            "hybrid_confidence": hybrid,
+            "model_confidence": model_conf,
+            "keyword_confidence": mov.compute_keyword_confidence(text, label),
+            "validation_passed": hybrid >= 0.7,
+        },
+    }
+
+
+def test_keyword_confidence_counts_class_keywords():
+    text = "Signed and approved final policy"
+    keywords = mov.SCHEDULE_6_KEYWORDS["OFFICIAL"]
+    expected = sum(1 for kw in keywords if kw in text.lower()) / len(keywords)
+    assert mov.compute_keyword_confidence(text, "official") == expected
+    assert mov.compute_keyword_confidence(text, "UNKNOWN") == 0.0
+
+
+def test_find_keywords_preserves_schedule_order():
+    found = mov.find_keywords("Invoice and budget ledger", "FINANCIAL")
+    assert found == ["invoice", "ledger", "budget"]
+
+
+def test_keywords_match_whole_words_only():
+    assert mov.find_keywords("Please reply", "FACILITY") == []
+    assert mov.find_keywords("Signed lease, please file", "FACILITY") == ["lease"]
+    assert mov.find_keywords("short-term 911 call", "TRANSITORY") == ["short-term"]
+
+
+def test_keyword_hits_agree_across_backends(monkeypatch):
+    text = "purchase order receipt, please see the legal opinion on \u00e9invoice"
+    with_accelerators = mov._keyword_hits(text)
+    assert "invoice" not in with_accelerators.get("FINANCIAL", ())
+    mov._keyword_hits.cache_clear()
+    try:
+        monkeypatch.setattr(mov, "_HS_DATABASE", None)
+        assert mov._keyword_hits(text) == with_accelerators
+        mov._keyword_hits.cache_clear()
+        monkeypatch.setattr(mov, "_AC_AUTOMATON", None)
+        assert mov._keyword_hits(text) == with_accelerators
+    finally:
+        mov._keyword_hits.cache_clear()
+
+
+def test_rebuild_keyword_index_picks_up_new_keywords(monkeypatch):
+    keywords = dict(mov.SCHEDULE_6_KEYWORDS)
+    keywords["FINANCIAL"] = keywords["FINANCIAL"] + ["voucher"]
+    monkeypatch.setattr(mov, "SCHEDULE_6_KEYWORDS", keywords)
+    mov.rebuild_keyword_index()
+    try:
+        assert mov.find_keywords("travel voucher", "FINANCIAL") == ["voucher"]
+        output = _make_output("travel voucher", "FINANCIAL")
+        mov.validate_json_schema(output)
+    finally:
+        monkeypatch.undo()
+        mov.rebuild_keyword_index()
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+def test_validate_json_schema_rejects_out_of_range_score(monkeypatch, compiled):
+    if not compiled:
+        monkeypatch.setattr(mov, "_COMPILED_OUTPUT_VALIDATOR", None)
+    output = _make_output()
+    mov.validate_json_schema(output)
+    output["score"] = 1.5
+    with pytest.raises(mov.ValidationError):
+        mov.validate_json_schema(output)
+
+
+def test_fully_validate_model_output_accepts_consistent_output():
+    mov.fully_validate_model_output(_make_output())
+
+
+def test_fully_validate_model_outputs_reports_per_item():
+    good = _make_output()
+    bad = _make_output()
+    bad["label"] = "NOT_A_CLASS"
+    errors = mov.fully_validate_model_outputs([good, bad])
+    assert errors[0] is None
+    assert isinstance(errors[1], mov.ValidationError)
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+def test_schema_rejects_duplicate_or_unknown_keywords(monkeypatch, compiled):
+    if not compiled:
+        monkeypatch.setattr(mov, "_COMPILED_OUTPUT_VALIDATOR", None)
+    output = _make_output()
+    output["classification_details"]["keywords_found"] = ["final", "final"]
+    with pytest.raises(mov.ValidationError):
+        mov.validate_json_schema(output)
+    output["classification_details"]["keywords_found"] = ["not-a-keyword"]
+    with pytest.raises(mov.ValidationError):
+        mov.validate_json_schema(output)
+
+
+def test_hybrid_recheck_can_be_skipped():
+    output = _make_output()
+    output["classification_details"]["hybrid_confidence"] = 0.95
+    output["classification_details"]["validation_passed"] = True
+    with pytest.raises(mov.ValidationError, match="Hybrid confidence mismatch"):
+        mov.fully_validate_model_output(output)
+    mov.fully_validate_model_output(output, skip_hybrid_recheck=True)
+
+
+def test_unknown_label_rejected_before_schema():
+    output = _make_output()
+    output["label"] = "NOT_A_CLASS"
+    del output["timestamp"]
+    with pytest.raises(mov.ValidationError, match="not in allowed classes"):
+        mov.fully_validate_model_output(output)